@@ -1,23 +1,15 @@
-import pygame
-import Box2D
-import math
-import random
+import argparse
+import gc
 import time
+import tracemalloc
 
-from src.genome import Genome
-from src.cell import Cell
-from src.cellular_body_builder import CellularBodyBuilder
-
-from src.cell_gene import CellGene
-from src.cell_builder import CellBuilder
-from src.cellular_body import CellularBody
-
-from src.organism import Organism
-from src.organism_rendering import OrganismRendering
+from src.render_snapshot import RenderSnapshot
 from src.screen import Screen
-from src.food_morsel import FoodMorsel
-from src.contact_listener import ContactListener
 from src.camera import Camera
+from src.fixed_timestep import FixedTimestep
+from src.island_model import IslandModel
+from src.simulation import Simulation
+from src.cellular_body import CellularBody
 
 BLACK = (0, 0, 0)
 GREEN = (0, 255, 0)
@@ -27,112 +19,15 @@ DARK_GRAY = (64, 64, 64)
 YELLOW = (255, 255, 0)
 RED = (255, 0, 0)
 
-WORLD_WIDTH = 120  # meters
-WORLD_HEIGHT = 120  # meters
-POPULATION_MAXIMUM = 500
-ORGANISM_COUNT = POPULATION_MAXIMUM
-
 GRID_SIZE = 3  # 3x3 grid
 SCREEN_WIDTH = 50
 SCREEN_HEIGHT = 35
+VISIBILITY_MARGIN = 1.0  # meters around the viewport to query for things to draw
+
+def main(food_field=False):
+    import pygame
 
-STARTING_FOOD_COUNT = 2000  # Seed food to prevent immediate starvation
-FOOD_INCREMENT = 100  # Add this many food morsels when FPS is healthy
-FPS_CHECK_INTERVAL = 120  # Check FPS every 2 seconds (120 frames at 60 FPS)
-
-MUTATION_RATE = 0.01
-
-def generate_organisms(world, world_width, world_height, display):
-    organisms = []
-    remaining_organisms = ORGANISM_COUNT
-
-    # This code is unreachable due to the return above - removing it
-    while remaining_organisms > 0:
-        organisms.append(generate_organism(world, world_width, world_height, display))
-        remaining_organisms -= 1
-
-    return organisms
-
-def generate_organism(world, world_width, world_height, display):
-    # Keep trying until we get a legal cellular body
-    while True:
-        genome = Genome()
-        cellular_body_builder = CellularBodyBuilder(genome.cell_genes())
-        cellular_body = cellular_body_builder.cellular_body()
-
-        if cellular_body.is_legal():
-            print(genome.value())
-            # Generate random position within world bounds
-            x = random.uniform(0, world_width)
-            y = random.uniform(0, world_height)
-            return Organism(world, cellular_body, (x, y), genome)
-
-def generate_offspring(parent_a_genome, parent_b_genome, world, world_width, world_height, position):
-    # Keep trying until we get a legal cellular body
-    while True:
-        # Splice parent genomes
-        spliced_genome_string = Genome.splice(parent_a_genome, parent_b_genome)
-
-        # Apply mutations
-        mutated_genome_string = Genome.mutate(spliced_genome_string, mutation_rate=MUTATION_RATE)
-
-        # Create offspring genome from mutated string
-        offspring_genome = Genome.from_string(mutated_genome_string)
-        cellular_body_builder = CellularBodyBuilder(offspring_genome.cell_genes())
-        cellular_body = cellular_body_builder.cellular_body()
-
-        if cellular_body.is_legal():
-            print(f"Offspring genome: {offspring_genome.value()}")
-            return Organism(world, cellular_body, position, offspring_genome)
-
-def create_food_morsels(world, world_width, world_height, count=200):
-    food_morsels = []
-    for _ in range(count):
-        x = random.uniform(0, world_width)
-        y = random.uniform(0, world_height)
-        food_morsel = FoodMorsel(world, (x, y))
-        food_morsels.append(food_morsel)
-    return food_morsels
-
-def create_walls(world, world_width, world_height):
-    thickness = 1.0
-
-    # Bottom wall
-    world.CreateStaticBody(
-        position=(world_width/2, thickness/2),
-        shapes=Box2D.b2PolygonShape(box=(world_width/2, thickness/2))
-    )
-
-    # Top wall
-    world.CreateStaticBody(
-        position=(world_width/2, world_height - thickness/2),
-        shapes=Box2D.b2PolygonShape(box=(world_width/2, thickness/2))
-    )
-
-    # Left wall
-    world.CreateStaticBody(
-        position=(thickness/2, world_height/2),
-        shapes=Box2D.b2PolygonShape(box=(thickness/2, world_height/2))
-    )
-
-    # Right wall
-    world.CreateStaticBody(
-        position=(world_width - thickness/2, world_height/2),
-        shapes=Box2D.b2PolygonShape(box=(thickness/2, world_height/2))
-    )
-
-
-def reset_world(world, world_width, world_height, display):
-    organisms = generate_organisms(world, world_width, world_height, display)
-    food_morsels = create_food_morsels(world, world_width, world_height, STARTING_FOOD_COUNT)
-    contact_listener = ContactListener(organisms, food_morsels)
-    world.contactListener = contact_listener
-    return organisms, food_morsels, contact_listener
-
-def main():
     pygame.init()
-    # World size (physics simulation area)
-    world_width, world_height = (WORLD_WIDTH, WORLD_HEIGHT)
 
     # Display size (viewport window) - 3x3 grid of worlds
     screen = Screen(SCREEN_WIDTH, SCREEN_HEIGHT)
@@ -140,40 +35,26 @@ def main():
     pygame.display.set_caption("Mudskipper")
     clock = pygame.time.Clock()
     font = pygame.font.Font(None, 24)
-    world = Box2D.b2World(gravity=(0, 0))
-
-    organisms, food_morsels, contact_listener = reset_world(world, world_width, world_height, display)
-    frame_count = 0
-    run_number = 1
-    run_start_time = time.time()
 
-    # Records for most cycles
-    run_cycles = 0
-    most_cycles = 0
-    most_cycles_run = 0
+    simulation = Simulation(food_field=food_field)
 
-    # Cell count tracking variables
-    max_organism_size = 0
-    max_organism_size_run = 0
+    # World size (physics simulation area)
+    world_width, world_height = (simulation.world_width, simulation.world_height)
 
     # FPS tracking for performance-based food control
     fps_history = []
-    fps_update_interval = 10  # Update FPS every 10 frames
     healthy_fps_threshold = 40  # FPS above which food gets replenished
 
+    # Simulated time advances at a fixed rate, whatever the frame rate
+    timestep = FixedTimestep(Simulation.TICKS_PER_SECOND)
+
     # Create camera to view the 3x3 grid
     # Camera world size is the full 3x3 grid, viewport is the screen size
-    camera = Camera(WORLD_WIDTH * GRID_SIZE, WORLD_HEIGHT * GRID_SIZE, screen.width, screen.height)
+    camera = Camera(world_width * GRID_SIZE, world_height * GRID_SIZE, screen.width, screen.height)
     # Start camera at origin
     camera.x = 0
     camera.y = 0
 
-    contact_events = []
-
-    # Display counters (update every 60 frames)
-    population_count = len(organisms)
-    food_count = len(food_morsels)
-
     running = True
     while running:
         for event in pygame.event.get():
@@ -181,21 +62,7 @@ def main():
                 running = False
             elif event.type == pygame.KEYDOWN:
                 if event.key == pygame.K_SPACE:
-                    # Check if this run had the most cycles
-                    if run_cycles > most_cycles:
-                        print(f"New cycle record: {run_cycles} cycles (Run #{run_number})")
-                        most_cycles = run_cycles
-                        most_cycles_run = run_number
-
-                    run_number += 1
-                    run_cycles = 0
-                    run_start_time = time.time()
-                    organisms.clear()
-                    organisms, food_morsels, contact_listener = reset_world(world, world_width, world_height, display)
-                    population_count = len(organisms)
-                    food_count = len(food_morsels)
-
-        frame_count += 1
+                    simulation.start_next_run()
 
         # Update FPS calculation
         current_fps = clock.get_fps()
@@ -205,100 +72,23 @@ def main():
 
         avg_fps = sum(fps_history) / len(fps_history) if fps_history else 60
 
-        if frame_count % 60 == 0:
-            print("-----------------------")
-            print(f"tick: {frame_count}")
-
-            # Calculate average cell count and track max organism size
-            if organisms:
-                cell_counts = [len(organism.cells()) for organism in organisms]
-                avg_cell_count = sum(cell_counts) / len(cell_counts)
-                current_max = max(cell_counts)
-
-                # Update max organism size record
-                if current_max > max_organism_size:
-                    max_organism_size = current_max
-                    max_organism_size_run = run_number
-
-                print(f"Avg cells per organism: {avg_cell_count:.1f}")
-                print(f"Biggest organism record: {max_organism_size} cells (Run #{max_organism_size_run})")
-
-            # Get contact events from contact listener
-            contact_events = contact_listener.get_contact_events()
-
-            # Process each contact event
-            for contact_event in contact_events:
-                organism_a = contact_event['organism_a']
-                organism_b = contact_event['organism_b']
-                position = contact_event['position']
-
-                while organism_a.can_reproduce() and organism_b.can_reproduce() and len(organisms) < POPULATION_MAXIMUM:
-                    organism_a.subtract_reproduction_cost()
-                    organism_b.subtract_reproduction_cost()
-
-                    offspring = generate_offspring(
-                        organism_a.genome(),
-                        organism_b.genome(),
-                        world, world_width, world_height, position
-                    )
-                    organisms.append(offspring)
-                    contact_listener.add_organism(offspring)
-
-            # Flush contact events
-            contact_events = []
-
-            # Update display counters
-            population_count = len(organisms)
-            food_count = len(food_morsels)
-
-        # Performance-based incremental food addition
-        # Check FPS and add food every few seconds if performance is healthy
-        if frame_count % FPS_CHECK_INTERVAL == 0:
-            if avg_fps > healthy_fps_threshold:
-                new_food = create_food_morsels(world, world_width, world_height, FOOD_INCREMENT)
-                food_morsels.extend(new_food)
-                for food_morsel in new_food:
-                    contact_listener.add_food_morsel(food_morsel)
-                run_cycles += 1
-                print(f"FPS healthy ({avg_fps:.1f}): Added {FOOD_INCREMENT} food morsels (total: {len(food_morsels)})")
-                print(f"Cycle {run_cycles} complete")
-            else:
-                print(f"FPS too low ({avg_fps:.1f}): No food added - organisms compete for existing food")
-
-        # Update food count every frame for responsiveness
-        food_count = len(food_morsels)
-
-        # Check if population is too low - restart if so
-        if len(organisms) < 2:
-            print(f"Run #{run_number} ended - population fell to {len(organisms)} after {run_cycles} cycles")
-
-            # Check if this run had the most cycles
-            if run_cycles > most_cycles:
-                most_cycles = run_cycles
-                most_cycles_run = run_number
-                print(f"New cycle record: {run_cycles} cycles (Run #{run_number})")
-
-            run_number += 1
-            run_cycles = 0
-            run_start_time = time.time()
-            print(f"Starting Run #{run_number}")
-
-            # Clear existing organisms and food from physics world
-            for organism in organisms:
-                world.DestroyBody(organism.body)
-            for food_morsel in food_morsels:
-                world.DestroyBody(food_morsel.body)
-
-            # Reset everything
-            organisms, food_morsels, contact_listener = reset_world(world, world_width, world_height, display)
-            frame_count = 0
-            population_count = len(organisms)
-            food_count = len(food_morsels)
-            contact_events = []
-
-            print(f"Run #{run_number} started with {len(organisms)} organisms")
-            if most_cycles > 0:
-                print(f"Record cycle count so far: {most_cycles} cycles (Run #{most_cycles_run})")
+        # Run as many fixed-length simulation ticks as real time calls for
+        for _ in range(timestep.ticks_due(time.perf_counter())):
+            # Performance-based incremental food addition
+            # Food is only added every few seconds if performance is healthy
+            if (simulation.frame_count + 1) % Simulation.FPS_CHECK_INTERVAL == 0:
+                if avg_fps > healthy_fps_threshold:
+                    print(f"FPS healthy ({avg_fps:.1f})")
+                else:
+                    print(f"FPS too low ({avg_fps:.1f})")
+
+            simulation.step(food_allowed=avg_fps > healthy_fps_threshold)
+
+        # Render between the last two physics steps
+        alpha = simulation.interpolation_alpha(timestep.tick_fraction())
+
+        organisms = simulation.organisms
+        food_radius = Screen.to_pixels(simulation.food_radius())
 
         # Continuous camera movement
         keys = pygame.key.get_pressed()
@@ -331,107 +121,40 @@ def main():
         tiles_to_draw_x = right_tile - left_tile + 1
         tiles_to_draw_y = bottom_tile - top_tile + 1
 
-        # Draw all necessary tiles to cover the visible area
+        # Find what each tile's copy of the world shows through the viewport.
+        # An organism hanging over the world's edge is found again by the
+        # neighboring tile's query, which draws the part a ghost would.
+        visible_tiles = []
         for grid_x in range(tiles_to_draw_x):
             for grid_y in range(tiles_to_draw_y):
                 # Calculate offset for this grid cell relative to the base tile
                 offset_x = (base_tile_x + grid_x) * world_width
                 offset_y = (base_tile_y + grid_y) * world_height
 
-                # Draw world border for this grid cell
-                world_x1, world_y1 = camera.world_to_screen(offset_x, offset_y)
-                world_x2, world_y2 = camera.world_to_screen(offset_x + world_width, offset_y + world_height)
-                world_rect = pygame.Rect(
-                    Screen.to_pixels(world_x1),
-                    Screen.to_pixels(world_y1),
-                    Screen.to_pixels(world_x2 - world_x1),
-                    Screen.to_pixels(world_y2 - world_y1)
+                # The margin covers organisms drawn between physics steps, behind their fixtures
+                visible_organisms, visible_food_positions = simulation.entities_in_rect(
+                    *camera.visible_rect(offset_x, offset_y, margin=VISIBILITY_MARGIN)
                 )
-
-        # Draw organisms in all visible tiles
-        for grid_x in range(tiles_to_draw_x):
-            for grid_y in range(tiles_to_draw_y):
-                # Calculate offset for this grid cell relative to the base tile
-                offset_x = (base_tile_x + grid_x) * world_width
-                offset_y = (base_tile_y + grid_y) * world_height
-
-                # Check if this tile is visible at all
-                tile_left = offset_x
-                tile_right = offset_x + world_width
-                tile_top = offset_y
-                tile_bottom = offset_y + world_height
-
-                # If tile is completely outside camera view, skip it
-                if (tile_right < camera.x or tile_left > camera.x + screen.width or
-                    tile_bottom < camera.y or tile_top > camera.y + screen.height):
-                    continue
-
-                # Draw all organisms in this grid cell
-                for organism in organisms:
-                    if organism.is_alive():
-                        organism_rendering = OrganismRendering(organism, screen, camera)
-
-                        # Draw organism at offset position for this grid cell
-                        cell_renderings = organism_rendering._cell_renderings_with_offset(offset_x, offset_y)
-                        for cell_rendering in cell_renderings:
-                            pygame.draw.polygon(display, cell_rendering['fill_color'], cell_rendering['vertices'])
-                            pygame.draw.polygon(display, cell_rendering['border_color'], cell_rendering['vertices'], width=2)
-
-                        # Draw ghost organisms for this grid cell
-                        ghost_renderings = organism_rendering.ghost_rendering_with_grid_offset(world_width, world_height, offset_x, offset_y)
-                        for ghost_rendering in ghost_renderings:
-                            pygame.draw.polygon(display, ghost_rendering['fill_color'], ghost_rendering['vertices'])
-                            pygame.draw.polygon(display, ghost_rendering['border_color'], ghost_rendering['vertices'], width=2)
-
-
-        # Update organisms and handle toroidal wrapping
-        organisms_to_remove = []
-        for organism in organisms:
-            organism.update_clock()
-            if organism.is_alive():
-                organism_rendering = OrganismRendering(organism, screen, camera)
-
-                # Check if organism needs toroidal teleportation
-                wrap_position = organism_rendering.get_wrap_position(world_width, world_height)
-                if wrap_position:
-                    # Teleport organism to wrapped position
-                    organism.body.position = wrap_position
-            else:
-                world.DestroyBody(organism.body)
-                organisms_to_remove.append(organism)
-
-        for organism in organisms_to_remove:
-            organisms.remove(organism)
-            contact_listener.remove_organism(organism)
-
-        # Draw food morsels in all visible tiles
-        for grid_x in range(tiles_to_draw_x):
-            for grid_y in range(tiles_to_draw_y):
-                # Calculate offset for this grid cell relative to the base tile
-                offset_x = (base_tile_x + grid_x) * world_width
-                offset_y = (base_tile_y + grid_y) * world_height
-
-                # Draw all food morsels in this grid cell
-                for food_morsel in food_morsels:
-                    if not food_morsel.eaten:
-                        pos = food_morsel.body.position
-                        # Apply offset for this grid cell
-                        screen_x, screen_y = camera.world_to_screen(pos.x + offset_x, pos.y + offset_y)
-                        x = Screen.to_pixels(screen_x)
-                        y = Screen.to_pixels(screen_y)
-                        radius = Screen.to_pixels(food_morsel.radius)
-                        pygame.draw.circle(display, GREEN, (int(x), int(y)), int(radius))
-
-        # Remove eaten food morsels
-        food_morsels_to_remove = []
-        for food_morsel in food_morsels:
-            if food_morsel.eaten:
-                world.DestroyBody(food_morsel.body)
-                food_morsels_to_remove.append(food_morsel)
-
-        for food_morsel in food_morsels_to_remove:
-            food_morsels.remove(food_morsel)
-            contact_listener.remove_food_morsel(food_morsel)
+                visible_tiles.append((offset_x, offset_y, visible_organisms, visible_food_positions))
+
+        # Transform each visible organism once; each tile draws a translated copy
+        organisms_in_view = dict.fromkeys(organism for _, _, tile_organisms, _ in visible_tiles for organism in tile_organisms)
+        snapshot = RenderSnapshot(organisms_in_view, world_width, world_height, alpha)
+
+        # Draw the visible organisms in every tile
+        for offset_x, offset_y, visible_organisms, _ in visible_tiles:
+            for cell_rendering in snapshot.cell_renderings(camera, offset_x, offset_y, visible_organisms, ghosts=False):
+                pygame.draw.polygon(display, cell_rendering['fill_color'], cell_rendering['vertices'])
+                pygame.draw.polygon(display, cell_rendering['border_color'], cell_rendering['vertices'], width=2)
+
+        # Draw the visible food morsels in every tile
+        for offset_x, offset_y, _, visible_food_positions in visible_tiles:
+            for food_x, food_y in visible_food_positions:
+                # Apply offset for this grid cell
+                screen_x, screen_y = camera.world_to_screen(food_x + offset_x, food_y + offset_y)
+                x = Screen.to_pixels(screen_x)
+                y = Screen.to_pixels(screen_y)
+                pygame.draw.circle(display, GREEN, (int(x), int(y)), int(food_radius))
 
         # Display FPS, population, food counts, run number, and timer
         # FPS display with color coding
@@ -447,25 +170,25 @@ def main():
         fps_surface = font.render(fps_text, False, fps_color)
         display.blit(fps_surface, (10, 10))
 
-        population_text = f"Population: {population_count}"
+        population_text = f"Population: {len(organisms)}"
         population_surface = font.render(population_text, False, WHITE)
         display.blit(population_surface, (10, 35))
 
-        food_text = f"Food: {food_count}"
+        food_text = f"Food: {simulation.food_count()}"
         food_surface = font.render(food_text, False, WHITE)
         display.blit(food_surface, (10, 60))
 
-        run_text = f"Run: {run_number}"
+        run_text = f"Run: {simulation.run_number}"
         run_surface = font.render(run_text, False, WHITE)
         display.blit(run_surface, (10, 85))
 
         # Current run cycles
-        cycles_text = f"Cycle count: {run_cycles}"
+        cycles_text = f"Cycle count: {simulation.run_cycles}"
         cycles_surface = font.render(cycles_text, False, WHITE)
         display.blit(cycles_surface, (10, 110))
         # Most cycles record
-        if most_cycles > 0:
-            record_text = f"Record cycle count: {most_cycles} (Run #{most_cycles_run})"
+        if simulation.most_cycles > 0:
+            record_text = f"Record cycle count: {simulation.most_cycles} (Run #{simulation.most_cycles_run})"
             record_surface = font.render(record_text, False, WHITE)
             display.blit(record_surface, (10, 135))
         # Cell count stats
@@ -474,19 +197,91 @@ def main():
             avg_cells_text = f"Cell count average: {current_avg_cells:.1f}"
             avg_cells_surface = font.render(avg_cells_text, False, WHITE)
             display.blit(avg_cells_surface, (10, 160))
-            if max_organism_size > 0:
-                biggest_text = f"Record organism size: {max_organism_size} cells (Run #{max_organism_size_run})"
+            if simulation.max_organism_size > 0:
+                biggest_text = f"Record organism size: {simulation.max_organism_size} cells (Run #{simulation.max_organism_size_run})"
                 biggest_surface = font.render(biggest_text, False, WHITE)
                 display.blit(biggest_surface, (10, 185))
 
         pygame.display.flip()
-        clock.tick(60)
-
-        # Step the physics simulation at 30 FPS for better performance
-        if frame_count % 2 == 0:
-            world.Step(2.0/60, 6, 2)  # Double timestep every other frame
+        # Render as fast as the machine allows; the clock only measures FPS
+        clock.tick()
 
     pygame.quit()
 
+def main_headless(ticks, food_field=False):
+    """Run the simulation without pygame, as fast as the CPU allows."""
+    simulation = Simulation(food_field=food_field)
+    start_time = time.time()
+
+    for _ in range(ticks):
+        simulation.step()
+
+    elapsed = time.time() - start_time
+    simulation.record_run_cycles()
+    records = simulation.records()
+    print("=======================")
+    print(f"Headless run finished: {ticks} ticks in {elapsed:.1f}s ({ticks / elapsed:.1f} ticks/s)")
+    print(f"Record cycle count: {records['most_cycles']} (Run #{records['most_cycles_run']})")
+    print(f"Record organism size: {records['max_organism_size']} cells (Run #{records['max_organism_size_run']})")
+    print(f"Bodies in world: {simulation.world_manager.body_counts()}")
+    print(f"Move legality cache: {CellularBody.legality_cache.stats()}")
+    print(f"Body attempts: {simulation.body_attempts}")
+    print(f"Placement legality cache: {simulation.placement_legality_cache.stats()}")
+
+def main_islands(island_count, ticks, migration_interval, food_field=False):
+    """Run independent headless worlds in parallel, migrating genomes between them."""
+    island_model = IslandModel(island_count, migration_interval, food_field=food_field)
+    island_model.start()
+    start_time = time.time()
+
+    try:
+        while island_model.ticks < ticks:
+            records = island_model.run(min(migration_interval, ticks - island_model.ticks))
+            print(f"tick: {records['ticks']}")
+            print(f"Record cycle count: {records['most_cycles']} (Island #{records['most_cycles_island']})")
+            print(f"Record organism size: {records['max_organism_size']} cells (Island #{records['max_organism_size_island']})")
+    finally:
+        island_model.stop()
+
+    elapsed = time.time() - start_time
+    print("=======================")
+    print(f"Island run finished: {island_count} islands x {ticks} ticks in {elapsed:.1f}s")
+
+def main_memory_report(organism_count):
+    """Print how much Python memory each organism and its cells take up."""
+    simulation = Simulation(organism_count=1, starting_food_count=0, verbose=False)
+    gc.collect()
+    tracemalloc.start()
+    before = tracemalloc.take_snapshot()
+
+    organisms = [simulation.generate_organism() for _ in range(organism_count)]
+    gc.collect()
+
+    after = tracemalloc.take_snapshot()
+    tracemalloc.stop()
+    allocated = sum(statistic.size_diff for statistic in after.compare_to(before, 'filename'))
+    cell_count = sum(len(organism.cells()) for organism in organisms)
+    print(f"{organism_count} organisms, {cell_count} cells: {allocated} bytes")
+    print(f"Bytes per organism: {allocated / organism_count:.0f}")
+    print(f"Bytes per cell (including its organism's share): {allocated / cell_count:.0f}")
+
+def parse_arguments():
+    parser = argparse.ArgumentParser(description="Mudskipper")
+    parser.add_argument("--headless", action="store_true", help="run the simulation without a display")
+    parser.add_argument("--ticks", type=int, default=3600, help="number of ticks to run in headless mode")
+    parser.add_argument("--islands", type=int, default=0, help="run this many headless worlds in parallel processes")
+    parser.add_argument("--food-field", action="store_true", help="keep food in a spatial grid instead of Box2D bodies")
+    parser.add_argument("--migration-interval", type=int, default=600, help="ticks between genome migrations across islands")
+    parser.add_argument("--memory-report", type=int, metavar="ORGANISMS", help="print Python memory per organism for this many organisms")
+    return parser.parse_args()
+
 if __name__ == "__main__":
-    main()
+    arguments = parse_arguments()
+    if arguments.memory_report:
+        main_memory_report(arguments.memory_report)
+    elif arguments.islands:
+        main_islands(arguments.islands, arguments.ticks, arguments.migration_interval, arguments.food_field)
+    elif arguments.headless:
+        main_headless(arguments.ticks, arguments.food_field)
+    else:
+        main(arguments.food_field)
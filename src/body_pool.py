@@ -0,0 +1,50 @@
+import Box2D
+
+class BodyPool:
+    """
+    Recycles dynamic Box2D bodies. A released body is deactivated, which
+    takes its fixtures out of the broadphase and contact solver; acquiring
+    it again moves it into place and switches it back on instead of
+    allocating a new body.
+    """
+
+    def __init__(self, world, keep_fixtures=True):
+        self.world = world
+        # Food bodies keep their circle; organism bodies get new cells each time
+        self.keep_fixtures = keep_fixtures
+        self.free_bodies = []
+
+    def __len__(self):
+        return len(self.free_bodies)
+
+    def acquire(self, position):
+        if not self.free_bodies:
+            return self._create_body(position)
+
+        body = self.free_bodies.pop()
+        body.transform = (position, 0)
+        body.linearVelocity = (0, 0)
+        body.angularVelocity = 0
+        body.active = True
+        body.awake = True
+        return body
+
+    def release(self, body):
+        body.active = False
+        if not self.keep_fixtures:
+            for fixture in list(body.fixtures):
+                body.DestroyFixture(fixture)
+        self.free_bodies.append(body)
+
+    def reserve(self, count):
+        """Make sure count bodies are waiting, so a later burst of spawns doesn't allocate."""
+        while len(self.free_bodies) < count:
+            body = self._create_body((0, 0))
+            body.active = False
+            self.free_bodies.append(body)
+
+    def _create_body(self, position):
+        body_def = Box2D.b2BodyDef()
+        body_def.type = Box2D.b2_dynamicBody
+        body_def.position = position
+        return self.world.CreateBody(body_def)
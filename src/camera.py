@@ -18,6 +18,18 @@ class Camera:
         screen_y = world_y - self.y
         return screen_x, screen_y
 
+    def visible_rect(self, offset_x=0, offset_y=0, margin=0):
+        """
+        The viewport as (min_x, min_y, max_x, max_y) in the coordinates of a
+        world copy drawn at the given offset.
+        """
+        return (
+            self.x - offset_x - margin,
+            self.y - offset_y - margin,
+            self.x + self.viewport_width - offset_x + margin,
+            self.y + self.viewport_height - offset_y + margin
+        )
+
     def is_visible(self, world_x, world_y, margin=2):
         """Check if a world position is visible in the viewport."""
         return (self.x - margin <= world_x <= self.x + self.viewport_width + margin and
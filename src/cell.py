@@ -1,4 +1,26 @@
-from src.cellular_body import CellularBody
+import copy
+from src.cell_store import CellStore
+from src.color import Color
+
+def _store_column(name):
+    """A property that reads and writes this cell's row of a CellStore column."""
+    def getter(cell):
+        return getattr(cell.store, name)[cell.row].item()
+
+    def setter(cell, value):
+        getattr(cell.store, name)[cell.row] = value
+
+    return property(getter, setter)
+
+def _store_total_column(name):
+    """Like _store_column, but writes go through the store so its body totals keep up."""
+    def getter(cell):
+        return getattr(cell.store, name)[cell.row].item()
+
+    def setter(cell, value):
+        getattr(cell.store, f"set_{name}")(cell.row, value)
+
+    return property(getter, setter)
 
 class Cell:
     STIMULATION_COLOR = (255, 255, 0)
@@ -9,68 +31,113 @@ class Cell:
     MAX_HEALTH = 5000
     FOOD_MORSEL_HEALTH_VALUE = 500
     REPRODUCTION_COST = 200
-
-    def __init__(self, position, radius, border_color, fill_color, movement_deltas):
+    DEFAULT_PROPAGATION_DELAY = 1
+    # Based on world size of 120x120, reasonable hex coordinate range is about ±150
+    MAX_HEX_COORD = 150
+
+    # Clock state for every cell lives here; each cell is a view over one row
+    store = CellStore()
+
+    __slots__ = (
+        'position', 'q', 'r', 's', 'radius',
+        'original_border_color', 'original_fill_color',
+        'movement_deltas', 'movement_index',
+        'cellular_body', '_gene', 'row',
+    )
+
+    health = _store_total_column('health')
+    clock_tick_count = _store_column('clock_tick_count')
+    last_stimulation_tick = _store_column('last_stimulation_tick')
+    stimulation_count = _store_total_column('stimulation_count')
+
+    def __init__(self, position, radius, border_color, fill_color, movement_deltas, gene=None):
         self.position = position
         self.q, self.r, self.s = position
         self.radius = radius
-        self.border_color = border_color
-        self.fill_color = fill_color
+        self.original_border_color = border_color
         self.original_fill_color = fill_color
         self.movement_deltas = movement_deltas
         self.movement_index = 0  # Track which movement delta to try next
-        self.clock_tick_count = 0
-        self.ticks_left_before_unstimulated = 0
-        self.ticks_left_before_stimulation_propagation = 0
-        self.stimulation_count = 0
-        self.last_stimulation_tick = -self.REFRACTORY_PERIOD
-        self.cellular_body = CellularBody([])
+        self.cellular_body = None  # Set when the cell joins a CellularBody
+        self._gene = None
+
+        self.row = self.store.allocate(self)
         self.health = self.STARTING_HEALTH
+        self.last_stimulation_tick = -self.REFRACTORY_PERIOD
+        self.store.propagation_delay[self.row] = self.DEFAULT_PROPAGATION_DELAY
+        if gene is not None:
+            self.gene = gene
+
+    def __deepcopy__(self, memo):
+        """A copy is a cell in its own right, with its own row."""
+        cell = self.__class__.__new__(self.__class__)
+        memo[id(self)] = cell
+        cell.row = self.store.copy_row(self.row, cell)
+        # The body goes last, since copying it indexes this cell
+        for name in Cell.__slots__:
+            if name not in ('row', 'cellular_body'):
+                setattr(cell, name, copy.deepcopy(getattr(self, name), memo))
+        cell.cellular_body = copy.deepcopy(self.cellular_body, memo)
+        return cell
+
+    @property
+    def gene(self):
+        return self._gene
+
+    @gene.setter
+    def gene(self, gene):
+        self._gene = gene
+        # Use genetically determined propagation delay
+        self.store.propagation_delay[self.row] = gene.stimulation_propagation_delay()
+
+    @property
+    def fill_color(self):
+        if self.store.stimulated[self.row]:
+            return self.STIMULATION_COLOR
+        return self.original_fill_color
+
+    @property
+    def border_color(self):
+        if self.is_alive():
+            return self.original_border_color
+        return self.DEATH_COLOR
 
     def update_clock(self):
-        if self.health <= 0:
-            return
-
-        self.clock_tick_count += 1
-
-        self.health -= 1
-        if self.health <= 0:
-            self.die()
-
-        if self.ticks_left_before_unstimulated > 0:
-            self.fill_color = self.STIMULATION_COLOR
-            self.ticks_left_before_unstimulated -= 1
-            if self.ticks_left_before_unstimulated == 0:
-                # Use genetically determined propagation delay
-                propagation_delay = self.gene.stimulation_propagation_delay() if hasattr(self, 'gene') else 1
-                self.ticks_left_before_stimulation_propagation = propagation_delay
-        else:
-            self.fill_color = self.original_fill_color
-        if self.ticks_left_before_stimulation_propagation > 0:
-            self.ticks_left_before_stimulation_propagation -= 1
-            if self.ticks_left_before_stimulation_propagation == 0:
-                self.stimulate_neighbors()
+        self.store.update_clock([self.row])
 
     def stimulate(self):
         if not(self.is_alive()):
             return
 
-        self.cellular_body.respond_to_cell_stimulation(self)
+        if self.cellular_body is not None:
+            self.cellular_body.respond_to_cell_stimulation(self)
 
-        if self.clock_tick_count - self.last_stimulation_tick < self.REFRACTORY_PERIOD:
+        clock_tick_count = self.store.stimulation_clock(self.row)
+        if clock_tick_count - self.last_stimulation_tick < self.REFRACTORY_PERIOD:
             return
         self.stimulation_count += 1
-        self.ticks_left_before_unstimulated = self.STIMULATION_DURATION
-        self.last_stimulation_tick = self.clock_tick_count
+        self.last_stimulation_tick = clock_tick_count
+        self.store.schedule_stimulation(self.row, self.STIMULATION_DURATION)
 
     def stimulate_neighbors(self):
         for neighbor in self.neighbors():
             neighbor.stimulate()
 
     def neighbors(self):
+        if self.cellular_body is None:
+            return []
         return self.cellular_body.neighbors(self)
 
     def move(self, delta):
+        old_position = self.position
+        self.position = self.moved_position(delta)
+        self.q, self.r, self.s = self.position
+        # Let the body reindex the cell, and the organism reshape only this cell's fixture
+        if self.cellular_body is not None:
+            self.cellular_body.cell_moved(self, old_position)
+
+    def moved_position(self, delta):
+        """Where move(delta) would put this cell, without moving it."""
         q, r, s = self.position
         dq, dr, ds = delta
         new_q = q + dq
@@ -78,8 +145,7 @@ class Cell:
         new_s = s + ds
 
         # Clamp hex coordinates to prevent extreme values that cause Box2D issues
-        # Based on world size of 120x120, reasonable hex coordinate range is about ±150
-        MAX_HEX_COORD = 150
+        MAX_HEX_COORD = self.MAX_HEX_COORD
         new_q = max(-MAX_HEX_COORD, min(MAX_HEX_COORD, new_q))
         new_r = max(-MAX_HEX_COORD, min(MAX_HEX_COORD, new_r))
         new_s = max(-MAX_HEX_COORD, min(MAX_HEX_COORD, new_s))
@@ -100,13 +166,13 @@ class Cell:
             else:
                 new_s -= coord_sum
 
-        self.position = (new_q, new_r, new_s)
-        self.q, self.r, self.s = self.position
-        # Note: Position change will be detected by organism's _have_cells_moved() check
+        return (new_q, new_r, new_s)
 
-    def die(self):
-        self.fill_color = self.DEATH_COLOR
-        self.border_color = self.DEATH_COLOR
+    def moves_without_clamping(self, delta):
+        """Whether moved_position(delta) is simply position + delta, with nothing clamped or corrected."""
+        if sum(delta) != 0:
+            return False
+        return all(abs(coordinate + change) <= self.MAX_HEX_COORD for coordinate, change in zip(self.position, delta))
 
     def is_alive(self):
         return self.health > 0
@@ -122,13 +188,4 @@ class Cell:
         """Get a color that fades to light gray as health declines."""
         # Calculate health percentage (0.0 to 1.0)
         health_percentage = max(0, min(1, self.health / self.STARTING_HEALTH))
-
-        # Ghost gray color (light gray)
-        ghost_gray = (200, 200, 200)
-
-        # Interpolate between base color and ghost gray
-        r = int(base_color[0] * health_percentage + ghost_gray[0] * (1 - health_percentage))
-        g = int(base_color[1] * health_percentage + ghost_gray[1] * (1 - health_percentage))
-        b = int(base_color[2] * health_percentage + ghost_gray[2] * (1 - health_percentage))
-
-        return (r, g, b)
+        return Color.faded(base_color, health_percentage)
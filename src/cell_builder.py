@@ -8,13 +8,12 @@ class CellBuilder:
         self.position = position
 
     def cell(self):
-        cell = CellFactory.create(
+        return CellFactory.create(
             self.cell_gene.cell_type(),
             self.position,
             self.DEFAULT_RADIUS,
             self.cell_gene.border_color(),
             self.cell_gene.fill_color(),
-            self.cell_gene.movement_deltas()
+            self.cell_gene.movement_deltas(),
+            self.cell_gene
         )
-        cell.gene = self.cell_gene
-        return cell
@@ -3,8 +3,8 @@ from src.pulser_cell import PulserCell
 
 class CellFactory:
     @staticmethod
-    def create(cell_type, position, radius, border_color, fill_color, movement_deltas):
+    def create(cell_type, position, radius, border_color, fill_color, movement_deltas, gene=None):
         if cell_type == "pulser":
-            return PulserCell(position, radius, border_color, fill_color, movement_deltas)
+            return PulserCell(position, radius, border_color, fill_color, movement_deltas, gene)
         else:
-            return Cell(position, radius, border_color, fill_color, movement_deltas)
\ No newline at end of file
+            return Cell(position, radius, border_color, fill_color, movement_deltas, gene)
\ No newline at end of file
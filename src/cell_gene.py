@@ -34,8 +34,57 @@ class CellGene(Gene):
         "default": (0, 255, 0),
     }
 
+    __slots__ = ('_phenotype',)
+
+    # Gene value -> decoded phenotype, shared by every gene with that value
+    _phenotypes = {}
+    MAX_PHENOTYPES = 4096
+
     def __init__(self, value_or_length):
         super().__init__(value_or_length)
+        # Decoded on first use, so genes past a genome's cell count never are
+        self._phenotype = None
+
+    @property
+    def phenotype(self):
+        if self._phenotype is None:
+            self._phenotype = self._phenotype_for(self.value)
+        return self._phenotype
+
+    @classmethod
+    def _phenotype_for(cls, value):
+        """
+        Decode every field of a gene value once: (placement delta, movement
+        deltas, cell type, pulse interval, stimulation propagation delay).
+        """
+        if not isinstance(value, str):
+            value = "".join(str(bit) for bit in value)
+
+        phenotype = cls._phenotypes.get(value)
+        if phenotype is None:
+            fields = {}
+            start = 0
+            for name, length in cls.GENE_SECTION_LENGTHS.items():
+                fields[name] = value[start:start + length]
+                start += length
+
+            phenotype = (
+                cls.LEGAL_DELTAS[int(fields['placement_delta'], 2)],
+                tuple(
+                    cls.LEGAL_DELTAS[int(fields[name], 2)]
+                    for name in ('movement_delta_1', 'movement_delta_2', 'movement_delta_3')
+                ),
+                "pulser" if fields['cell_type'] == "11" else "default",
+                # 7-bit value (0-127) plus 1 for range 1-128
+                int(fields['pulse_interval'], 2) + 1,
+                # 3-bit value (0-7) plus 1 for range 1-8
+                int(fields['stimulation_propagation_delay'], 2) + 1,
+            )
+            if len(cls._phenotypes) >= cls.MAX_PHENOTYPES:
+                # Genes keep their own phenotype, so clearing only costs some sharing
+                cls._phenotypes.clear()
+            cls._phenotypes[value] = phenotype
+        return phenotype
 
     @staticmethod
     def random():
@@ -55,14 +104,10 @@ class CellGene(Gene):
             start += self.GENE_SECTION_LENGTHS[name]
 
     def placement_delta(self):
-        return self.LEGAL_DELTAS[self.int_value('placement_delta')]
+        return self.phenotype[0]
 
     def movement_deltas(self):
-        return [
-            self.LEGAL_DELTAS[self.int_value('movement_delta_1')],
-            self.LEGAL_DELTAS[self.int_value('movement_delta_2')],
-            self.LEGAL_DELTAS[self.int_value('movement_delta_3')]
-        ]
+        return self.phenotype[1]
 
     def int_value(self, section_name):
         return int(self.section(section_name), 2)
@@ -74,15 +119,10 @@ class CellGene(Gene):
         return self.BORDER_COLORS_BY_CELL_TYPE[self.cell_type()]
 
     def cell_type(self):
-        if self.section('cell_type') == "11":
-            return "pulser"
-        else:
-            return "default"
+        return self.phenotype[2]
 
     def pulse_interval(self):
-        # Get 7-bit value (0-127) and add 1 for range 1-128
-        return self.int_value('pulse_interval') + 1
+        return self.phenotype[3]
 
     def stimulation_propagation_delay(self):
-        # Get 3-bit value (0-7) and add 1 for range 1-8
-        return self.int_value('stimulation_propagation_delay') + 1
+        return self.phenotype[4]
@@ -0,0 +1,272 @@
+import numpy as np
+
+class CellStore:
+    """
+    Clock state for every cell in the population, one row per cell in
+    shared NumPy arrays. A Cell only keeps its row number.
+
+    Pulses, stimulation display and neighbor propagation are scheduled on
+    timer wheels at the exact tick they're due, so a tick only does Python
+    work for the cells that have something happening. Ticks are counted by
+    the store; a row that misses ticks (its cell is dead, or it wasn't
+    passed to update_clock) has its pending deadlines pushed back by the
+    ticks it missed, as if its countdowns had been frozen.
+
+    Each CellularBody also gets a body slot holding running totals of its
+    cells' health, stimulation count and living cells, kept up to date by
+    every change to those columns.
+    """
+
+    INITIAL_CAPACITY = 1024
+    INITIAL_BODY_CAPACITY = 256
+    NO_BODY = 0  # Body slot for cells outside any CellularBody; its totals are never read
+    WHEEL_SIZE = 256  # ticks; must exceed the longest delay anything is scheduled with
+    NOT_SCHEDULED = -1
+
+    COLUMNS = {
+        'health': np.int64,
+        'clock_tick_count': np.int64,
+        'last_stimulation_tick': np.int64,
+        'stimulation_count': np.int64,
+        'pulse_interval': np.int64,  # 0 for cells that don't pulse
+        'propagation_delay': np.int64,
+        'stimulated': np.bool_,  # Whether the cell shows as stimulated
+        'last_update_tick': np.int64,  # Store tick this row's clock last advanced on
+        'body': np.intp,  # Body slot whose totals this row counts toward
+        # Store ticks events are due on, or NOT_SCHEDULED
+        'pulse_tick': np.int64,
+        'show_stimulation_tick': np.int64,
+        'unstimulate_tick': np.int64,
+        'propagation_tick': np.int64,
+    }
+
+    # Deadline column -> the wheel it's scheduled on
+    EVENT_COLUMNS = ('pulse_tick', 'show_stimulation_tick', 'unstimulate_tick', 'propagation_tick')
+
+    BODY_COLUMNS = ('body_health', 'body_stimulation_count', 'body_living_cell_count')
+
+    def __init__(self, capacity=None):
+        self.capacity = capacity or self.INITIAL_CAPACITY
+        for name, dtype in self.COLUMNS.items():
+            setattr(self, name, np.zeros(self.capacity, dtype=dtype))
+        # Row -> Cell, so events can call back into Python
+        self.cells = [None] * self.capacity
+        self.free_rows = list(range(self.capacity - 1, -1, -1))
+
+        self.body_capacity = self.INITIAL_BODY_CAPACITY
+        for name in self.BODY_COLUMNS:
+            setattr(self, name, np.zeros(self.body_capacity, dtype=np.int64))
+        self.free_bodies = list(range(self.body_capacity - 1, self.NO_BODY, -1))
+
+        self.tick = 0
+        # The last tick whose countdowns are done; lags self.tick while pulses fire
+        self.counted_down_tick = 0
+        # Row whose stimulation update_clock is propagating to its neighbors, if any
+        self.propagating_row = None
+        self.wheels = {
+            column: [[] for _ in range(self.WHEEL_SIZE)] for column in self.EVENT_COLUMNS
+        }
+
+    def __len__(self):
+        """Number of rows in use."""
+        return self.capacity - len(self.free_rows)
+
+    def allocate(self, cell):
+        if not self.free_rows:
+            self._grow()
+
+        row = self.free_rows.pop()
+        for name in self.COLUMNS:
+            getattr(self, name)[row] = 0
+        for column in self.EVENT_COLUMNS:
+            getattr(self, column)[row] = self.NOT_SCHEDULED
+        self.last_update_tick[row] = self.tick
+        self.cells[row] = cell
+        return row
+
+    def free(self, rows):
+        """Give rows back for reuse. Rows are freed explicitly, never by garbage collection."""
+        for row in rows:
+            self.cells[row] = None
+            self.free_rows.append(row)
+
+    def _grow(self):
+        old_capacity = self.capacity
+        self.capacity *= 2
+        for name, dtype in self.COLUMNS.items():
+            column = np.zeros(self.capacity, dtype=dtype)
+            column[:old_capacity] = getattr(self, name)
+            setattr(self, name, column)
+        self.cells.extend([None] * old_capacity)
+        self.free_rows.extend(range(self.capacity - 1, old_capacity - 1, -1))
+
+    def copy_row(self, row, cell):
+        """A new row with the same state as row, for a copy of its cell."""
+        new_row = self.allocate(cell)
+        for name in self.COLUMNS:
+            getattr(self, name)[new_row] = getattr(self, name)[row]
+        self.body[new_row] = self.NO_BODY
+        for column in self.EVENT_COLUMNS:
+            deadline = getattr(self, column)[row]
+            if deadline != self.NOT_SCHEDULED:
+                self.schedule(column, new_row, deadline)
+        return new_row
+
+    def allocate_body(self, rows):
+        """Give rows a body slot and total up their state in it."""
+        if not self.free_bodies:
+            self._grow_bodies()
+
+        body = self.free_bodies.pop()
+        self.body[rows] = body
+        self.body_health[body] = self.health[rows].sum()
+        self.body_stimulation_count[body] = self.stimulation_count[rows].sum()
+        self.body_living_cell_count[body] = (self.health[rows] > 0).sum()
+        return body
+
+    def free_body(self, body):
+        self.free_bodies.append(body)
+
+    def _grow_bodies(self):
+        old_capacity = self.body_capacity
+        self.body_capacity *= 2
+        for name in self.BODY_COLUMNS:
+            column = np.zeros(self.body_capacity, dtype=np.int64)
+            column[:old_capacity] = getattr(self, name)
+            setattr(self, name, column)
+        self.free_bodies.extend(range(self.body_capacity - 1, old_capacity - 1, -1))
+
+    def set_health(self, row, health):
+        old_health = self.health[row]
+        self.health[row] = health
+        body = self.body[row]
+        self.body_health[body] += health - old_health
+        self.body_living_cell_count[body] += int(health > 0) - int(old_health > 0)
+
+    def set_stimulation_count(self, row, stimulation_count):
+        body = self.body[row]
+        self.body_stimulation_count[body] += stimulation_count - self.stimulation_count[row]
+        self.stimulation_count[row] = stimulation_count
+
+    def schedule(self, column, row, tick):
+        getattr(self, column)[row] = tick
+        self.wheels[column][tick % self.WHEEL_SIZE].append(row)
+
+    def set_pulse_interval(self, row, pulse_interval):
+        """Make the row pulse whenever its clock reaches a multiple of pulse_interval."""
+        self.pulse_interval[row] = pulse_interval
+        ticks_until_pulse = -self.clock_tick_count[row] % pulse_interval
+        self.schedule('pulse_tick', row, self.last_update_tick[row] + 1 + ticks_until_pulse)
+
+    def _stimulated_before_tick(self, row):
+        """
+        Whether a stimulation propagated to row counts as arriving before
+        row's clock advanced this tick. Cells used to tick one at a time in
+        body order, propagating as they went, so a neighbor later in the
+        body hadn't ticked yet.
+        """
+        if self.propagating_row is None or self.last_update_tick[row] != self.tick:
+            return False
+        cell = self.cells[row]
+        cell_indices = cell.cellular_body.cell_indices
+        return cell_indices[cell] > cell_indices[self.cells[self.propagating_row]]
+
+    def stimulation_clock(self, row):
+        """The clock reading a stimulation of row is timed by, for its refractory period."""
+        if self._stimulated_before_tick(row):
+            return self.clock_tick_count[row] - 1
+        return self.clock_tick_count[row]
+
+    def schedule_stimulation(self, row, duration):
+        """
+        Show the row as stimulated for duration ticks, then propagate to its
+        neighbors after its propagation delay.
+        """
+        if self._stimulated_before_tick(row):
+            # This tick's stimulations are already shown, so show it now
+            base_tick = self.tick - 1
+            self.stimulated[row] = True
+            self.show_stimulation_tick[row] = self.NOT_SCHEDULED
+        else:
+            if self.last_update_tick[row] == self.tick:
+                base_tick = self.counted_down_tick
+            else:
+                base_tick = self.last_update_tick[row]
+            self.schedule('show_stimulation_tick', row, base_tick + 1)
+
+        self.schedule('unstimulate_tick', row, base_tick + 1 + duration)
+        self.schedule('propagation_tick', row, base_tick + duration - 1 + self.propagation_delay[row])
+
+    def _due_rows(self, column, tick):
+        """Rows whose event in column is due this tick, taken off the wheel."""
+        wheel = self.wheels[column]
+        slot = tick % self.WHEEL_SIZE
+        if not wheel[slot]:
+            return []
+
+        rows = np.array(wheel[slot], dtype=np.intp)
+        wheel[slot] = []
+        deadlines = getattr(self, column)
+        # Entries go stale when a deadline moves; rows that didn't tick keep theirs for later
+        due = (deadlines[rows] == tick) & (self.last_update_tick[rows] == tick)
+        rows = np.unique(rows[due])
+        deadlines[rows] = self.NOT_SCHEDULED
+        return rows.tolist()
+
+    def _postpone(self, rows, missed_ticks):
+        """Push back the pending deadlines of rows that missed ticks, as if they'd been frozen."""
+        for column in self.EVENT_COLUMNS:
+            deadlines = getattr(self, column)
+            pending = deadlines[rows] != self.NOT_SCHEDULED
+            for row, deadline in zip(rows[pending].tolist(), (deadlines[rows[pending]] + missed_ticks[pending]).tolist()):
+                self.schedule(column, row, deadline)
+
+    def update_clock(self, rows):
+        """
+        Advance the clocks of the cells in the given rows by one tick. Pulses
+        fire first, then every living cell ages and its stimulation shows or
+        clears, then finished stimulations propagate to neighbors.
+        """
+        self.tick += 1
+        tick = self.tick
+        rows = np.asarray(rows, dtype=np.intp)
+        rows = rows[self.health[rows] > 0]
+
+        missed_ticks = tick - 1 - self.last_update_tick[rows]
+        missed = missed_ticks > 0
+        if missed.any():
+            self._postpone(rows[missed], missed_ticks[missed])
+        self.last_update_tick[rows] = tick
+        self.counted_down_tick = tick - 1
+
+        pulsed_rows = self._due_rows('pulse_tick', tick)
+        for row in pulsed_rows:
+            self.schedule('pulse_tick', row, tick + self.pulse_interval[row])
+            self.cells[row].pulse()
+        if pulsed_rows:
+            # A pulse can cost a cell the last of its health, which stops its clock this tick
+            pulsed_rows = np.array(pulsed_rows, dtype=np.intp)
+            killed_rows = pulsed_rows[self.health[pulsed_rows] <= 0]
+            self.last_update_tick[killed_rows] = tick - 1
+            # Its clock stays on the pulse tick, so it pulses again as soon as it's revived
+            for row in killed_rows.tolist():
+                self.schedule('pulse_tick', row, tick)
+            rows = rows[self.health[rows] > 0]
+
+        self.clock_tick_count[rows] += 1
+        self.health[rows] -= 1
+        self.body_health -= np.bincount(self.body[rows], minlength=self.body_capacity)
+        died_rows = rows[self.health[rows] == 0]
+        if len(died_rows):
+            self.body_living_cell_count -= np.bincount(self.body[died_rows], minlength=self.body_capacity)
+
+        self.stimulated[self._due_rows('show_stimulation_tick', tick)] = True
+        self.stimulated[self._due_rows('unstimulate_tick', tick)] = False
+        self.counted_down_tick = tick
+
+        try:
+            for row in self._due_rows('propagation_tick', tick):
+                self.propagating_row = row
+                self.cells[row].stimulate_neighbors()
+        finally:
+            self.propagating_row = None
@@ -1,17 +1,47 @@
 import copy
+import numpy as np
+from src.move_legality_cache import MoveLegalityCache
 
 class CellularBody:
+    # In order around the ring, so consecutive offsets are neighbors of each other
+    NEIGHBOR_OFFSETS = (
+        (1, 0, -1),
+        (1, -1, 0),
+        (0, -1, 1),
+        (-1, 0, 1),
+        (-1, 1, 0),
+        (0, 1, -1)
+    )
+
+    # Shared by every body, so organisms with the same shape reuse each other's answers
+    legality_cache = MoveLegalityCache()
+
     def __init__(self, cells):
         self.cells = cells
+        self.moved_cells = []  # Cells that moved since the last take_moved_cells()
+        self._cell_rows = None
+        self._body_slot = self.store().allocate_body(self.cell_rows()) if self.cells else None
+        self._shape = None
+        self.cell_indices = {cell: i for i, cell in enumerate(self.cells)}
         for cell in self.cells:
             cell.cellular_body = self
+        self._index_cells()
+
+    def __deepcopy__(self, memo):
+        """A copy gets its own body slot, built from copies of the cells."""
+        cellular_body = CellularBody.__new__(CellularBody)
+        memo[id(self)] = cellular_body
+        cellular_body.__init__(copy.deepcopy(self.cells, memo))
+        return cellular_body
+
+    def _index_cells(self):
+        # (q, r, s) -> Cell; overlapping cells share a key, so the index comes up short
+        self.cells_by_position = {cell.position: cell for cell in self.cells}
 
     def respond_to_cell_stimulation(self, cell):
-        if not(cell in self.cells):
+        if self.cells_by_position.get(cell.position) is not cell:
             return
 
-        i = self.cells.index(cell)
-
         # Round-robin through movement deltas, starting from current movement_index
         attempts = 0
         num_movements = len(cell.movement_deltas)
@@ -19,12 +49,10 @@ class CellularBody:
         while attempts < num_movements:
             delta = cell.movement_deltas[cell.movement_index]
 
-            test_cells = copy.deepcopy(self.cells)
-            test_cells[i].move(delta)
-            test_body = CellularBody(test_cells)
-
-            if test_body.is_legal():
+            legal, shape_after_move = self.check_move(cell, delta)
+            if legal:
                 cell.move(delta)
+                self._shape = shape_after_move
                 # Advance to next movement for next stimulation
                 cell.movement_index = (cell.movement_index + 1) % num_movements
                 return
@@ -33,9 +61,143 @@ class CellularBody:
             cell.movement_index = (cell.movement_index + 1) % num_movements
             attempts += 1
 
+    def shape(self):
+        """Cell positions relative to the first cell, the same for every translation of the body."""
+        if self._shape is None:
+            origin_q, origin_r, origin_s = self.cells[0].position
+            self._shape = tuple((q - origin_q, r - origin_r, s - origin_s) for q, r, s in (cell.position for cell in self.cells))
+        return self._shape
+
+    def check_move(self, cell, delta):
+        """
+        Whether moving cell by delta is legal, and the shape the body would
+        have afterwards, looked up in the legality cache where possible.
+        """
+        if not cell.moves_without_clamping(delta):
+            # Clamped or corrected moves depend on where the body is, not just its shape
+            return self.is_legal_move(cell, delta), None
+
+        key = (self.shape(), self.cell_indices[cell], delta)
+        entry = self.legality_cache.get(key)
+        if entry is None:
+            legal = self.is_legal_move(cell, delta)
+            shape_after_move = self._shape_after_move(cell, delta) if legal else key[0]
+            entry = (legal, shape_after_move)
+            self.legality_cache.put(key, entry)
+        return entry
+
+    def _shape_after_move(self, cell, delta):
+        shape = list(self.shape())
+        dq, dr, ds = delta
+        q, r, s = shape[self.cell_indices[cell]]
+        shape[self.cell_indices[cell]] = (q + dq, r + dr, s + ds)
+        origin_q, origin_r, origin_s = shape[0]
+        return tuple((q - origin_q, r - origin_r, s - origin_s) for q, r, s in shape)
+
+    def is_legal_move(self, cell, delta):
+        """
+        Whether moving cell by delta would leave the body legal, worked out
+        in place rather than on a copy. Assumes the body is legal now, which
+        an organism's body always is.
+        """
+        old_position = cell.position
+        new_position = cell.moved_position(delta)
+        if new_position == old_position or len(self.cells) == 1:
+            return True
+        if new_position in self.cells_by_position:
+            return False
+
+        # The cell has to land next to one of the cells it leaves behind...
+        if not any(
+            position != old_position and position in self.cells_by_position
+            for position in self.neighbor_positions(new_position)
+        ):
+            return False
+
+        # ...and leaving its old hex mustn't split the rest of the body
+        if self._is_removable(old_position):
+            return True
+        return self._is_contiguous_after_move(old_position, new_position)
+
+    def _is_removable(self, position):
+        """
+        Local articulation check: the occupied hexes around position form
+        a single unbroken arc, so they stay connected to each other without it.
+        """
+        occupied = [neighbor_position in self.cells_by_position for neighbor_position in self.neighbor_positions(position)]
+        arc_count = sum(1 for i in range(6) if occupied[i] and not occupied[i - 1])
+        return arc_count <= 1
+
+    def _is_contiguous_after_move(self, old_position, new_position):
+        positions = set(self.cells_by_position)
+        positions.discard(old_position)
+        positions.add(new_position)
+
+        visited = {new_position}
+        queue = [new_position]
+        while queue:
+            current = queue.pop()
+            for neighbor_position in self.neighbor_positions(current):
+                if neighbor_position in positions and neighbor_position not in visited:
+                    visited.add(neighbor_position)
+                    queue.append(neighbor_position)
+        return len(visited) == len(positions)
+
     def update_clock(self):
-        for cell in self.cells:
-            cell.update_clock()
+        if self.cells:
+            self.store().update_clock(self.cell_rows())
+
+    def store(self):
+        return self.cells[0].store
+
+    def cell_rows(self):
+        """The CellStore rows of this body's cells, in cell order."""
+        if self._cell_rows is None:
+            self._cell_rows = np.array([cell.row for cell in self.cells], dtype=np.intp)
+        return self._cell_rows
+
+    def release(self):
+        """Free this body's CellStore rows once it's been discarded or its organism removed."""
+        if self.cells:
+            self.store().free(self.cell_rows().tolist())
+            self.store().free_body(self._body_slot)
+
+    # Running totals the CellStore keeps as cells change, so these don't visit every cell
+    def health(self):
+        if not self.cells:
+            return 0
+        return int(self.store().body_health[self._body_slot])
+
+    def stimulation_count(self):
+        if not self.cells:
+            return 0
+        return int(self.store().body_stimulation_count[self._body_slot])
+
+    def living_cell_count(self):
+        if not self.cells:
+            return 0
+        return int(self.store().body_living_cell_count[self._body_slot])
+
+    def is_alive(self):
+        return self.living_cell_count() > 0
+
+    def cell_moved(self, cell, old_position):
+        self._shape = None
+        if len(self.cells_by_position) == len(self.cells) and self.cells_by_position.get(old_position) is cell:
+            del self.cells_by_position[old_position]
+            self.cells_by_position[cell.position] = cell
+        else:
+            # Overlapping cells share a key, so work out who's where from scratch
+            self._index_cells()
+
+        if cell not in self.moved_cells:
+            self.moved_cells.append(cell)
+
+    def take_moved_cells(self):
+        """Return the cells that moved since the last call, and forget them."""
+        moved_cells = self.moved_cells
+        self.moved_cells = []
+        return moved_cells
 
     def is_legal(self):
         return not self.contains_overlaps() and self.is_contiguous() and self.has_valid_coordinates()
@@ -68,31 +230,17 @@ class CellularBody:
         return len(visited) == len(self.cells)
 
     def contains_overlaps(self):
-        for i in range(len(self.cells)):
-            for j in range(i + 1, len(self.cells)):
-                if (self.cells[i].q == self.cells[j].q and
-                    self.cells[i].r == self.cells[j].r and
-                    self.cells[i].s == self.cells[j].s):
-                    return True
-        return False
+        return len(self.cells_by_position) != len(self.cells)
 
     def neighbors(self, cell):
         neighbors = []
-
-        neighbor_offsets = [
-            (1, 0, -1),
-            (1, -1, 0),
-            (0, -1, 1),
-            (-1, 0, 1),
-            (-1, 1, 0),
-            (0, 1, -1)
-        ]
-
-        for other_cell in self.cells:
-            if other_cell != cell:
-                q_diff = other_cell.q - cell.q
-                r_diff = other_cell.r - cell.r
-                s_diff = other_cell.s - cell.s
-                if (q_diff, r_diff, s_diff) in neighbor_offsets:
-                    neighbors.append(other_cell)
+        for neighbor_position in self.neighbor_positions(cell.position):
+            neighbor = self.cells_by_position.get(neighbor_position)
+            if neighbor is not None:
+                neighbors.append(neighbor)
         return neighbors
+
+    def neighbor_positions(self, position):
+        """The six hexes around position, in order around the ring."""
+        q, r, s = position
+        return [(q + dq, r + dr, s + ds) for dq, dr, ds in self.NEIGHBOR_OFFSETS]
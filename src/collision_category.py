@@ -0,0 +1,15 @@
+class CollisionCategory:
+    """
+    Box2D filter bits. Box2D skips a pair of fixtures unless each one's
+    category is in the other's mask, so pairs we don't care about (food on
+    food, food on a wall) never create a contact or call back into Python.
+    """
+
+    ORGANISM = 0x0001
+    FOOD = 0x0002
+    WALL = 0x0004
+
+    # Walls still have to stop organisms, so organism-wall pairs collide too
+    ORGANISM_MASK = ORGANISM | FOOD | WALL
+    FOOD_MASK = ORGANISM
+    WALL_MASK = ORGANISM
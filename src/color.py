@@ -23,6 +23,29 @@ class Color:
         ORANGE
     ]
 
+    # What a cell fades to as its health runs out
+    GHOST_GRAY = (200, 200, 200)
+    # Faded colors are looked up by health rounded to one of this many steps
+    HEALTH_FADE_STEPS = 64
+
+    # (base color, step) -> faded color
+    _faded_colors = {}
+
+    @classmethod
+    def faded(cls, base_color, health_percentage):
+        """base_color blended toward GHOST_GRAY as health_percentage (0.0 to 1.0) falls."""
+        step = round(health_percentage * cls.HEALTH_FADE_STEPS)
+        key = (base_color, step)
+        color = cls._faded_colors.get(key)
+        if color is None:
+            fraction = step / cls.HEALTH_FADE_STEPS
+            color = tuple(
+                int(base * fraction + gray * (1 - fraction))
+                for base, gray in zip(base_color, cls.GHOST_GRAY)
+            )
+            cls._faded_colors[key] = color
+        return color
+
     @classmethod
     def from_genome(cls, genome_string):
         """Get a color from the palette based on genome checksum."""
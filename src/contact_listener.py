@@ -1,18 +1,21 @@
 import Box2D
 from src.food_morsel import FoodMorsel
+from src.organism import Organism
 
 class ContactListener(Box2D.b2ContactListener):
-    def __init__(self, organisms, food_morsels):
-        Box2D.b2ContactListener.__init__(self)
-        self.organisms = organisms
-        self.food_morsels = food_morsels
-        self.touching_organisms = set()  # Set of organism pairs that are touching
-        self.contact_events = []  # List of contact events for reproduction
+    """
+    Records organism-organism contacts for reproduction and feeds organisms
+    the food they touch. Bodies lead back to their organism or food morsel
+    through body.userData, which the world manager's entity registries set.
+    """
 
-        # Spatial hash maps for O(1) lookups
-        self.body_to_organism = {}
-        self.body_to_food_morsel = {}
-        self._rebuild_spatial_hash()
+    def __init__(self):
+        Box2D.b2ContactListener.__init__(self)
+        # Organism -> {organism it's touching: number of touching cell contacts}
+        self.touching_organisms = {}
+        self.contact_events = {}  # Unordered pair of entity IDs -> contact event for reproduction
+        self.contact_event_pairs = {}  # Organism -> pairs of its pending contact events
+        self.eaten_food_morsels = []  # Eaten since the last take_eaten_food_morsels()
 
     def BeginContact(self, contact):
         body_a = contact.fixtureA.body
@@ -23,27 +26,21 @@ class ContactListener(Box2D.b2ContactListener):
         organism_b = self._get_organism(body_b)
 
         if organism_a and organism_b:
-            # Two organisms are touching
-            pair = tuple(sorted([id(organism_a), id(organism_b)]))  # Use IDs to ensure consistent ordering
-            self.touching_organisms.add(pair)
+            # Two organisms are touching; each pair of cells touching counts separately
+            self._add_touch(organism_a, organism_b, 1)
 
             # Add contact event for reproduction (only if this pair hasn't already been recorded)
-            world_manifold = contact.worldManifold
-            contact_position = world_manifold.points[0] if world_manifold.points else (0, 0)
-
-            # Check if this pair already has a contact event
-            pair_exists = any(
-                (event['organism_a'] == organism_a and event['organism_b'] == organism_b) or
-                (event['organism_a'] == organism_b and event['organism_b'] == organism_a)
-                for event in self.contact_events
-            )
-
-            if not pair_exists:
-                self.contact_events.append({
+            pair = self._pair(organism_a, organism_b)
+            if pair not in self.contact_events:
+                world_manifold = contact.worldManifold
+                contact_position = world_manifold.points[0] if world_manifold.points else (0, 0)
+                self.contact_events[pair] = {
                     'organism_a': organism_a,
                     'organism_b': organism_b,
                     'position': contact_position
-                })
+                }
+                self.contact_event_pairs.setdefault(organism_a, set()).add(pair)
+                self.contact_event_pairs.setdefault(organism_b, set()).add(pair)
             return
 
         # Check for organism-food collision
@@ -56,6 +53,7 @@ class ContactListener(Box2D.b2ContactListener):
             return
 
         food_morsel.eaten = True
+        self.eaten_food_morsels.append(food_morsel)
         organism.nourish()
 
     def EndContact(self, contact):
@@ -67,71 +65,75 @@ class ContactListener(Box2D.b2ContactListener):
         organism_b = self._get_organism(body_b)
 
         if organism_a and organism_b:
-            # Two organisms stopped touching
-            pair = tuple(sorted([id(organism_a), id(organism_b)]))
-            self.touching_organisms.discard(pair)  # Remove if exists
+            # Two cells stopped touching; the organisms may still touch elsewhere
+            self._add_touch(organism_a, organism_b, -1)
+
+    @staticmethod
+    def _pair(organism_a, organism_b):
+        """Key for an unordered pair of organisms. Entity IDs are never reused, unlike id()."""
+        if organism_a.entity_id < organism_b.entity_id:
+            return (organism_a.entity_id, organism_b.entity_id)
+        return (organism_b.entity_id, organism_a.entity_id)
+
+    def _add_touch(self, organism_a, organism_b, change):
+        for organism, other in ((organism_a, organism_b), (organism_b, organism_a)):
+            touching = self.touching_organisms.setdefault(organism, {})
+            count = touching.get(other, 0) + change
+            if count > 0:
+                touching[other] = count
+            else:
+                touching.pop(other, None)
+                if not touching:
+                    del self.touching_organisms[organism]
 
     def _get_organism(self, body):
-        """Find organism that owns the given body using spatial hash."""
-        return self.body_to_organism.get(body)
+        """Find the registered organism that owns the given body."""
+        entity = body.userData
+        return entity if isinstance(entity, Organism) else None
 
     def is_organism_touching(self, organism):
         """Check if an organism is touching any other organism."""
-        organism_id = id(organism)
-        for pair in self.touching_organisms:
-            if organism_id in pair:
-                return True
-        return False
+        return organism in self.touching_organisms
 
     def _food_morsel(self, body_a, body_b):
-        """Find food morsel using spatial hash."""
-        food_a = self.body_to_food_morsel.get(body_a)
-        if food_a:
-            return food_a
-        return self.body_to_food_morsel.get(body_b)
+        """Find the registered food morsel on either body."""
+        if isinstance(body_a.userData, FoodMorsel):
+            return body_a.userData
+        if isinstance(body_b.userData, FoodMorsel):
+            return body_b.userData
+        return None
 
     def _organism(self, body_a, body_b, food_body):
-        """Find organism using spatial hash."""
+        """Find the organism on whichever body isn't the food."""
         other_body = body_b if food_body == body_a else body_a
-        return self.body_to_organism.get(other_body)
+        return self._get_organism(other_body)
 
     def get_contact_events(self):
         """Get and clear the list of contact events."""
-        events = self.contact_events.copy()
+        events = list(self.contact_events.values())
         self.contact_events.clear()
+        self.contact_event_pairs.clear()
         return events
 
-    def _rebuild_spatial_hash(self):
-        """Rebuild the spatial hash maps for fast body lookups."""
-        self.body_to_organism.clear()
-        self.body_to_food_morsel.clear()
-
-        # Map organism bodies
-        for organism in self.organisms:
-            if hasattr(organism, 'body') and organism.body:
-                self.body_to_organism[organism.body] = organism
-
-        # Map food morsel bodies
-        for food_morsel in self.food_morsels:
-            if hasattr(food_morsel, 'body') and food_morsel.body:
-                self.body_to_food_morsel[food_morsel.body] = food_morsel
-
-    def add_organism(self, organism):
-        """Add organism to spatial hash when new organisms are created."""
-        if hasattr(organism, 'body') and organism.body:
-            self.body_to_organism[organism.body] = organism
+    def take_eaten_food_morsels(self):
+        """Get and clear the food morsels eaten since the last call."""
+        eaten_food_morsels = self.eaten_food_morsels
+        self.eaten_food_morsels = []
+        return eaten_food_morsels
 
     def remove_organism(self, organism):
-        """Remove organism from spatial hash when organisms are destroyed."""
-        if hasattr(organism, 'body') and organism.body:
-            self.body_to_organism.pop(organism.body, None)
-
-    def add_food_morsel(self, food_morsel):
-        """Add food morsel to spatial hash when new food is created."""
-        if hasattr(food_morsel, 'body') and food_morsel.body:
-            self.body_to_food_morsel[food_morsel.body] = food_morsel
-
-    def remove_food_morsel(self, food_morsel):
-        """Remove food morsel from spatial hash when food is eaten."""
-        if hasattr(food_morsel, 'body') and food_morsel.body:
-            self.body_to_food_morsel.pop(food_morsel.body, None)
+        """Drop organism from the touch adjacency and pending contact events when organisms are destroyed."""
+        # Its cell rows and body slot are freed, so breeding from its events would touch someone else's
+        for pair in self.contact_event_pairs.pop(organism, ()):
+            event = self.contact_events.pop(pair)
+            other = event['organism_b'] if event['organism_a'] is organism else event['organism_a']
+            other_pairs = self.contact_event_pairs[other]
+            other_pairs.discard(pair)
+            if not other_pairs:
+                del self.contact_event_pairs[other]
+
+        for other in self.touching_organisms.pop(organism, {}):
+            other_touching = self.touching_organisms[other]
+            del other_touching[organism]
+            if not other_touching:
+                del self.touching_organisms[other]
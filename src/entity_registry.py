@@ -0,0 +1,50 @@
+class EntityRegistry:
+    """
+    Dense storage for organisms or food morsels. Each entity added gets an
+    integer ID that is never handed out again, even after it's removed, and
+    its Box2D body points back to it through body.userData. Removal swaps
+    the last entity into the removed one's place, so it's O(1) but doesn't
+    keep insertion order.
+    """
+
+    def __init__(self):
+        self.entities = []
+        self.next_id = 0
+
+    def __len__(self):
+        return len(self.entities)
+
+    def __iter__(self):
+        return iter(self.entities)
+
+    def __getitem__(self, index):
+        return self.entities[index]
+
+    def __contains__(self, entity):
+        index = entity.registry_index
+        return index is not None and index < len(self.entities) and self.entities[index] is entity
+
+    def add(self, entity):
+        entity.entity_id = self.next_id
+        self.next_id += 1
+        entity.registry_index = len(self.entities)
+        self.entities.append(entity)
+        entity.body.userData = entity
+        return entity.entity_id
+
+    def remove(self, entity):
+        index = entity.registry_index
+        last_entity = self.entities.pop()
+        if last_entity is not entity:
+            self.entities[index] = last_entity
+            last_entity.registry_index = index
+
+        entity.registry_index = None
+        entity.body.userData = None
+
+    def clear(self):
+        """Remove every entity. IDs keep counting up from where they were."""
+        for entity in self.entities:
+            entity.registry_index = None
+            entity.body.userData = None
+        self.entities.clear()
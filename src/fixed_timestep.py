@@ -0,0 +1,31 @@
+class FixedTimestep:
+    """
+    Accumulates real elapsed time and hands it out as whole simulation
+    ticks, so simulated time runs at a fixed rate no matter how fast
+    frames are rendered.
+    """
+
+    MAX_TICKS_PER_FRAME = 8  # Drop time rather than spiral when the simulation can't keep up
+
+    def __init__(self, ticks_per_second):
+        self.tick_duration = 1.0 / ticks_per_second
+        self.accumulator = 0.0
+        self.last_time = None
+
+    def ticks_due(self, now):
+        """Return how many ticks to run for the real time elapsed since the last call."""
+        if self.last_time is not None:
+            self.accumulator += now - self.last_time
+        self.last_time = now
+
+        ticks = int(self.accumulator // self.tick_duration)
+        if ticks > self.MAX_TICKS_PER_FRAME:
+            ticks = self.MAX_TICKS_PER_FRAME
+            self.accumulator = ticks * self.tick_duration
+
+        self.accumulator -= ticks * self.tick_duration
+        return ticks
+
+    def tick_fraction(self):
+        """How far we are (0.0 to 1.0) between the last tick and the next one."""
+        return min(1.0, self.accumulator / self.tick_duration)
@@ -0,0 +1,186 @@
+import numpy as np
+import random
+
+class FoodField:
+    """
+    Food morsels as plain positions in NumPy arrays instead of Box2D bodies.
+    A uniform grid over the (toroidal) world finds the morsels near each
+    organism cell, so eating is resolved here rather than by the physics
+    contact listener.
+    """
+
+    RADIUS = 0.2
+    GRID_CELL_SIZE = 2.0  # meters; must be at least twice a cell's reach (cell radius + food radius)
+
+    def __init__(self, world_width, world_height, radius=None):
+        self.world_width = world_width
+        self.world_height = world_height
+        self.radius = radius or self.RADIUS
+
+        self.columns = max(1, int(world_width // self.GRID_CELL_SIZE))
+        self.rows = max(1, int(world_height // self.GRID_CELL_SIZE))
+        self.cell_width = world_width / self.columns
+        self.cell_height = world_height / self.rows
+
+        self.x = np.empty(0)
+        self.y = np.empty(0)
+        self._grid_is_stale = True
+
+    def __len__(self):
+        return len(self.x)
+
+    def add(self, positions):
+        positions = np.asarray(positions, dtype=float).reshape(-1, 2)
+        self.x = np.concatenate((self.x, positions[:, 0]))
+        self.y = np.concatenate((self.y, positions[:, 1]))
+        self._grid_is_stale = True
+
+    def add_random(self, count):
+        self.add([
+            (random.uniform(0, self.world_width), random.uniform(0, self.world_height))
+            for _ in range(count)
+        ])
+
+    def remove(self, indices):
+        keep = np.ones(len(self.x), dtype=bool)
+        keep[indices] = False
+        self.x = self.x[keep]
+        self.y = self.y[keep]
+        self._grid_is_stale = True
+
+    def clear(self):
+        self.x = np.empty(0)
+        self.y = np.empty(0)
+        self._grid_is_stale = True
+
+    def positions(self):
+        return zip(self.x.tolist(), self.y.tolist())
+
+    def _grid_coordinates(self, x, y):
+        """Grid column and row of each point, plus which half of its square it sits in."""
+        scaled_x = np.mod(x, self.world_width) / self.cell_width
+        scaled_y = np.mod(y, self.world_height) / self.cell_height
+        columns = np.minimum(scaled_x.astype(np.intp), self.columns - 1)
+        rows = np.minimum(scaled_y.astype(np.intp), self.rows - 1)
+        # -1 for the left/top half of a square, +1 for the right/bottom half
+        column_sides = np.where(scaled_x - columns < 0.5, -1, 1)
+        row_sides = np.where(scaled_y - rows < 0.5, -1, 1)
+        return columns, rows, column_sides, row_sides
+
+    def _rebuild_grid(self):
+        """Sort morsels by grid square; cell_starts[key] is where each square's morsels begin."""
+        columns, rows, _, _ = self._grid_coordinates(self.x, self.y)
+        keys = rows * self.columns + columns
+        self.sorted_indices = np.argsort(keys, kind='stable')
+        counts = np.bincount(keys, minlength=self.columns * self.rows)
+        self.cell_starts = np.concatenate(([0], np.cumsum(counts)))
+        self._grid_is_stale = False
+
+    def positions_in_rect(self, min_x, min_y, max_x, max_y):
+        """Positions of the morsels inside a rectangle of the world, found through the grid. The rectangle doesn't wrap."""
+        if self._grid_is_stale:
+            self._rebuild_grid()
+
+        first_column = max(0, int(min_x // self.cell_width))
+        last_column = min(self.columns - 1, int(max_x // self.cell_width))
+        first_row = max(0, int(min_y // self.cell_height))
+        last_row = min(self.rows - 1, int(max_y // self.cell_height))
+        if first_column > last_column or first_row > last_row:
+            return []
+
+        # Squares are keyed row by row, so each row's squares in range are one run of sorted_indices
+        runs = [
+            self.sorted_indices[self.cell_starts[row * self.columns + first_column]:self.cell_starts[row * self.columns + last_column + 1]]
+            for row in range(first_row, last_row + 1)
+        ]
+        indices = np.concatenate(runs)
+        x = self.x[indices]
+        y = self.y[indices]
+        inside = (x >= min_x) & (x <= max_x) & (y >= min_y) & (y <= max_y)
+        return list(zip(x[inside].tolist(), y[inside].tolist()))
+
+    def overlaps(self, centers_x, centers_y, reaches):
+        """
+        Find every (center, morsel) pair closer than the center's reach,
+        measuring distance across the wrapped world edges. Returns two index
+        arrays of equal length.
+        """
+        if self._grid_is_stale:
+            self._rebuild_grid()
+
+        center_columns, center_rows, column_sides, row_sides = self._grid_coordinates(centers_x, centers_y)
+        center_numbers = np.arange(len(centers_x))
+
+        center_parts = []
+        food_parts = []
+        # A reach of at most half a square only spills into the squares on
+        # the center's side: its own, the one beside, above/below, and diagonal
+        for use_column_side, use_row_side in ((0, 0), (1, 0), (0, 1), (1, 1)):
+            neighbor_columns = (center_columns + use_column_side * column_sides) % self.columns
+            neighbor_rows = (center_rows + use_row_side * row_sides) % self.rows
+            keys = neighbor_rows * self.columns + neighbor_columns
+            starts = self.cell_starts[keys]
+            counts = self.cell_starts[keys + 1] - starts
+            total = counts.sum()
+            if total == 0:
+                continue
+
+            # Expand each center's run of morsels into flat (center, morsel) candidate pairs
+            center_indices = np.repeat(center_numbers, counts)
+            run_offsets = np.arange(total) - np.repeat(np.cumsum(counts) - counts, counts)
+            food_indices = self.sorted_indices[np.repeat(starts, counts) + run_offsets]
+
+            dx = self.x[food_indices] - centers_x[center_indices]
+            dy = self.y[food_indices] - centers_y[center_indices]
+            dx -= self.world_width * np.round(dx / self.world_width)
+            dy -= self.world_height * np.round(dy / self.world_height)
+
+            close = dx * dx + dy * dy < reaches[center_indices] ** 2
+            center_parts.append(center_indices[close])
+            food_parts.append(food_indices[close])
+
+        if not food_parts:
+            return np.empty(0, dtype=np.intp), np.empty(0, dtype=np.intp)
+        return np.concatenate(center_parts), np.concatenate(food_parts)
+
+    def consume(self, organisms):
+        """
+        Nourish organisms for every morsel one of their cells touches, and
+        return the number eaten. Organisms are placed at the transform they
+        last saved with save_transform(), which saves reading every body
+        back out of Box2D.
+        """
+        if len(self.x) == 0 or not organisms:
+            return 0
+
+        local_centers = []
+        cell_counts = []
+        poses = []
+        reaches = []
+        for organism in organisms:
+            centers = organism.local_cell_centers()
+            local_centers.append(centers)
+            cell_counts.append(len(centers))
+            poses.append((*organism.previous_position, organism.previous_angle))
+            reaches.append(organism.cells()[0].radius + self.radius)
+
+        # Move every cell center into world coordinates in one batch
+        owners = np.repeat(np.arange(len(organisms)), cell_counts)
+        local_centers = np.concatenate(local_centers)
+        poses = np.array(poses)[owners]
+        cos_angles = np.cos(poses[:, 2])
+        sin_angles = np.sin(poses[:, 2])
+        centers_x = poses[:, 0] + cos_angles * local_centers[:, 0] - sin_angles * local_centers[:, 1]
+        centers_y = poses[:, 1] + sin_angles * local_centers[:, 0] + cos_angles * local_centers[:, 1]
+
+        center_indices, food_indices = self.overlaps(centers_x, centers_y, np.array(reaches)[owners])
+        if len(food_indices) == 0:
+            return 0
+
+        # A morsel only feeds the first organism found touching it
+        eaten, first_pairs = np.unique(food_indices, return_index=True)
+        for owner in owners[center_indices[first_pairs]].tolist():
+            organisms[owner].nourish()
+
+        self.remove(eaten)
+        return len(eaten)
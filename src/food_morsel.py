@@ -1,18 +1,37 @@
 import Box2D
+from src.collision_category import CollisionCategory
 
 class FoodMorsel:
-    def __init__(self, world, position, radius=0.2):
+    RADIUS = 0.2
+
+    __slots__ = ('world', 'position', 'radius', 'eaten', 'body', 'entity_id', 'registry_index')
+
+    def __init__(self, world, position, radius=None, body_pool=None):
         self.world = world
         self.position = position
-        self.radius = radius
+        self.radius = radius or self.RADIUS
         self.eaten = False
+        # Set by the EntityRegistry that holds this morsel
+        self.entity_id = None
+        self.registry_index = None
 
-        # Create dynamic Box2D body
-        body_def = Box2D.b2BodyDef()
-        body_def.type = Box2D.b2_dynamicBody
-        body_def.position = position
-        self.body = world.CreateBody(body_def)
+        if body_pool is not None:
+            # Recycled bodies already carry their circle fixture
+            self.body = body_pool.acquire(position)
+            if self.body.fixtures:
+                return
+        else:
+            # Create dynamic Box2D body
+            body_def = Box2D.b2BodyDef()
+            body_def.type = Box2D.b2_dynamicBody
+            body_def.position = position
+            self.body = world.CreateBody(body_def)
 
         # Create fixture
-        circle = Box2D.b2CircleShape(radius=radius)
-        self.body.CreateFixture(shape=circle, density=1.0)
+        circle = Box2D.b2CircleShape(radius=self.radius)
+        self.body.CreateFixture(
+            shape=circle,
+            density=1.0,
+            categoryBits=CollisionCategory.FOOD,
+            maskBits=CollisionCategory.FOOD_MASK
+        )
@@ -1,4 +1,6 @@
 class Gene:
+    __slots__ = ('value',)
+
     def __init__(self, value_or_length):
         if isinstance(value_or_length, int):
             self.value = [0] * value_or_length
@@ -31,6 +31,36 @@ class Genome:
         effective_count = self.effective_cell_count()
         return self._cell_genes[:effective_count]
 
+    def placement_deltas(self):
+        """Placement deltas of the active cells, in order."""
+        return [cell_gene.placement_delta() for cell_gene in self.cell_genes()]
+
+    @classmethod
+    def placement_deltas_from_bits(cls, bits, length):
+        """
+        The placement deltas from_string() would give a packed genome, read
+        straight from the bits. Returns None when the genome is too short to
+        say, since from_string() fills missing cells with random genes.
+        """
+        prefix_length = cls.cell_count_prefix_length()
+        cell_gene_length = sum(CellGene.GENE_SECTION_LENGTHS.values())
+        placement_length = CellGene.GENE_SECTION_LENGTHS['placement_delta']
+        if length < prefix_length:
+            return None
+
+        prefix_sum = bin(bits >> (length - prefix_length)).count("1")
+        effective_count = cls.MIN_CELL_COUNT + min(prefix_sum, cls.MAX_CELL_COUNT - cls.MIN_CELL_COUNT)
+        if prefix_length + effective_count * cell_gene_length > length:
+            return None
+
+        placement_mask = (1 << placement_length) - 1
+        placement_deltas = []
+        for i in range(effective_count):
+            # Bits are stored most significant first; placement is each gene's first section
+            gene_end = prefix_length + i * cell_gene_length + placement_length
+            placement_deltas.append(CellGene.LEGAL_DELTAS[(bits >> (length - gene_end)) & placement_mask])
+        return placement_deltas
+
     def value(self):
         """Return full genome string including prefix and all cell genes."""
         cell_genes_string = "".join([str(cell_gene.value) for cell_gene in self._cell_genes])
@@ -71,11 +101,23 @@ class Genome:
 
         return genome
 
+    @staticmethod
+    def to_bits(genome_string):
+        """Pack a genome string into an int, returned with its length in bits."""
+        if not genome_string:
+            return 0, 0
+        return int(genome_string, 2), len(genome_string)
+
+    @staticmethod
+    def from_bits(bits, length):
+        """Unpack an int from to_bits() back into a genome string."""
+        if length == 0:
+            return ''
+        return format(bits, f'0{length}b')
+
     @staticmethod
     def splice(genome_string_a, genome_string_b):
         """Create offspring genome by splicing two parent genomes at a random point."""
-        import random
-
         # Find the shorter genome length to avoid index errors
         min_length = min(len(genome_string_a), len(genome_string_b))
 
@@ -84,25 +126,56 @@ class Genome:
             prefix_length = Genome.cell_count_prefix_length()
             return '0' * prefix_length + '0' * (Genome.MAX_CELL_COUNT * sum(CellGene.GENE_SECTION_LENGTHS.values()))
 
-        # Choose a random splice point
-        splice_point = random.randint(0, min_length - 1)
+        bits_a, length_a = Genome.to_bits(genome_string_a)
+        bits_b, length_b = Genome.to_bits(genome_string_b)
+        return Genome.from_bits(Genome.splice_bits(bits_a, length_a, bits_b, length_b), length_b)
+
+    @staticmethod
+    def splice_bits(bits_a, length_a, bits_b, length_b):
+        """
+        Packed splice: the first bits of parent A up to a random point, then
+        the rest of parent B. The offspring has parent B's length.
+        """
+        import random
 
-        # Create offspring genome: first part from parent A, rest from parent B
-        offspring_genome_string = genome_string_a[:splice_point] + genome_string_b[splice_point:]
+        # Choose a random splice point
+        splice_point = random.randint(0, min(length_a, length_b) - 1)
 
-        return offspring_genome_string
+        # Bits are stored most significant first, so the string's tail is the low bits
+        tail_length = length_b - splice_point
+        head = bits_a >> (length_a - splice_point)
+        tail = bits_b & ((1 << tail_length) - 1)
+        return (head << tail_length) | tail
 
     @staticmethod
     def mutate(genome_string, mutation_rate):
         """Apply mutations to a genome string by flipping bits at the given rate."""
-        import random
+        bits, length = Genome.to_bits(genome_string)
+        return Genome.from_bits(Genome.mutate_bits(bits, length, mutation_rate), length)
 
-        mutated = []
-        for bit in genome_string:
-            if random.random() < mutation_rate:
-                # Flip the bit
-                mutated.append('0' if bit == '1' else '1')
-            else:
-                mutated.append(bit)
+    @staticmethod
+    def mutate_bits(bits, length, mutation_rate):
+        """
+        Packed mutation: flip each bit with probability mutation_rate, as one
+        XOR. Flip positions are found by drawing the geometric gaps between
+        them, so the cost is per flip rather than per bit.
+        """
+        import math
+        import random
 
-        return ''.join(mutated)
+        if mutation_rate <= 0:
+            return bits
+        if mutation_rate >= 1:
+            return bits ^ ((1 << length) - 1)
+
+        log_keep_rate = math.log(1 - mutation_rate)
+        flip_mask = 0
+        position = -1
+        while True:
+            # Number of bits kept before the next flip
+            position += 1 + int(math.log(1 - random.random()) / log_keep_rate)
+            if position >= length:
+                break
+            flip_mask |= 1 << position
+
+        return bits ^ flip_mask
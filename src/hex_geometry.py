@@ -0,0 +1,35 @@
+import math
+
+class HexGeometry:
+    """Axial hex coordinates to local world geometry, shared by physics and rendering."""
+
+    SQRT_3 = math.sqrt(3)
+
+    # Vertices of a hexagon of radius 1 centered on the origin
+    UNIT_HEXAGON = tuple(
+        (math.cos((math.pi / 3) * i), math.sin((math.pi / 3) * i)) for i in range(6)
+    )
+
+    # (q, r, radius) -> vertices; cells only ever occupy a bounded set of hexes
+    _vertices_cache = {}
+
+    @classmethod
+    def center(cls, q, r, radius):
+        """Center of the hex at (q, r) in the organism's local coordinates."""
+        x = (3/2 * q) * radius
+        y = (cls.SQRT_3/2 * q + cls.SQRT_3 * r) * radius
+        return (x, y)
+
+    @classmethod
+    def vertices(cls, q, r, radius):
+        """The six corners of the hex at (q, r), computed once and then shared."""
+        key = (q, r, radius)
+        vertices = cls._vertices_cache.get(key)
+        if vertices is None:
+            center_x, center_y = cls.center(q, r, radius)
+            vertices = tuple(
+                (center_x + radius * unit_x, center_y + radius * unit_y)
+                for unit_x, unit_y in cls.UNIT_HEXAGON
+            )
+            cls._vertices_cache[key] = vertices
+        return vertices
@@ -0,0 +1,132 @@
+import multiprocessing
+import random
+
+from src.simulation import Simulation
+
+def run_island(connection, seed, organism_count, starting_food_count, food_field):
+    """
+    Worker process entry point. Each island owns its own b2World and only
+    ever exchanges genome strings and records with the parent.
+    """
+    # Forked workers inherit the parent's random state, so reseed per island
+    random.seed(seed)
+    simulation = Simulation(
+        organism_count=organism_count,
+        starting_food_count=starting_food_count,
+        food_field=food_field,
+        verbose=False
+    )
+
+    while True:
+        command = connection.recv()
+        if command is None:
+            break
+
+        ticks, immigrants, migrant_count = command
+        simulation.add_immigrants(immigrants)
+        for _ in range(ticks):
+            simulation.step()
+
+        connection.send((simulation.emigrant_genomes(migrant_count), simulation.records()))
+
+    connection.close()
+
+class IslandModel:
+    """
+    Runs independent simulations in worker processes and every
+    migration_interval ticks passes a few genomes from each island to the
+    next one around a ring.
+    """
+
+    MIGRANT_COUNT = 3
+
+    def __init__(self, island_count, migration_interval, migrant_count=None, organism_count=None, starting_food_count=None, food_field=False, seed=None):
+        self.island_count = island_count
+        self.migration_interval = migration_interval
+        self.migrant_count = migrant_count or self.MIGRANT_COUNT
+        self.organism_count = organism_count
+        self.starting_food_count = starting_food_count
+        self.food_field = food_field
+        self.seed = random.randrange(2**32) if seed is None else seed
+
+        self.connections = []
+        self.processes = []
+        self.immigrants = [[] for _ in range(island_count)]
+        self.island_records = [None] * island_count
+        self.ticks = 0
+
+    def start(self):
+        for island_index in range(self.island_count):
+            parent_connection, child_connection = multiprocessing.Pipe()
+            process = multiprocessing.Process(
+                target=run_island,
+                args=(child_connection, self.seed + island_index, self.organism_count, self.starting_food_count, self.food_field),
+                daemon=True
+            )
+            process.start()
+            child_connection.close()
+            self.connections.append(parent_connection)
+            self.processes.append(process)
+
+    def stop(self):
+        for connection in self.connections:
+            connection.send(None)
+            connection.close()
+        for process in self.processes:
+            process.join()
+        self.connections = []
+        self.processes = []
+
+    def run(self, ticks):
+        """Advance every island by ticks, migrating between epochs. Returns the combined records."""
+        remaining_ticks = ticks
+        while remaining_ticks > 0:
+            epoch_ticks = min(self.migration_interval, remaining_ticks)
+            self._run_epoch(epoch_ticks)
+            remaining_ticks -= epoch_ticks
+        return self.records()
+
+    def _run_epoch(self, ticks):
+        # Send every island its work before waiting, so they all run in parallel
+        for island_index, connection in enumerate(self.connections):
+            connection.send((ticks, self.immigrants[island_index], self.migrant_count))
+
+        emigrants = []
+        for island_index, connection in enumerate(self.connections):
+            island_emigrants, records = connection.recv()
+            emigrants.append(island_emigrants)
+            self.island_records[island_index] = records
+
+        # Ring migration: each island's emigrants go to the next island
+        for island_index in range(self.island_count):
+            self.immigrants[(island_index + 1) % self.island_count] = emigrants[island_index]
+
+        self.ticks += ticks
+
+    def records(self):
+        """Best records across all islands, including runs still in progress."""
+        most_cycles = 0
+        most_cycles_island = None
+        max_organism_size = 0
+        max_organism_size_island = None
+
+        for island_index, records in enumerate(self.island_records):
+            if records is None:
+                continue
+
+            island_most_cycles = max(records['most_cycles'], records['run_cycles'])
+            if island_most_cycles > most_cycles:
+                most_cycles = island_most_cycles
+                most_cycles_island = island_index
+
+            if records['max_organism_size'] > max_organism_size:
+                max_organism_size = records['max_organism_size']
+                max_organism_size_island = island_index
+
+        return {
+            'ticks': self.ticks,
+            'most_cycles': most_cycles,
+            'most_cycles_island': most_cycles_island,
+            'max_organism_size': max_organism_size,
+            'max_organism_size_island': max_organism_size_island,
+        }
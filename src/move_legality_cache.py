@@ -0,0 +1,53 @@
+from collections import OrderedDict
+
+class MoveLegalityCache:
+    """
+    Bounded LRU memo of move legality. Keys are (shape, cell index, delta),
+    where shape is a body's cell positions relative to its first cell, so
+    every organism with the same body plan shares entries. Values are
+    (legal, shape after the move).
+    """
+
+    MAX_SIZE = 20000
+
+    def __init__(self, max_size=None):
+        self.max_size = max_size or self.MAX_SIZE
+        self.entries = OrderedDict()
+        self.hits = 0
+        self.misses = 0
+
+    def __len__(self):
+        return len(self.entries)
+
+    def get(self, key):
+        entry = self.entries.get(key)
+        if entry is None:
+            self.misses += 1
+            return None
+
+        self.hits += 1
+        self.entries.move_to_end(key)
+        return entry
+
+    def put(self, key, entry):
+        self.entries[key] = entry
+        self.entries.move_to_end(key)
+        if len(self.entries) > self.max_size:
+            self.entries.popitem(last=False)
+
+    def clear(self):
+        self.entries.clear()
+        self.hits = 0
+        self.misses = 0
+
+    def hit_rate(self):
+        lookups = self.hits + self.misses
+        return self.hits / lookups if lookups else 0.0
+
+    def stats(self):
+        return {
+            'hits': self.hits,
+            'misses': self.misses,
+            'hit_rate': self.hit_rate(),
+            'size': len(self.entries),
+        }
@@ -1,92 +1,136 @@
 import Box2D
-import math
+import numpy as np
 from src.color import Color
+from src.collision_category import CollisionCategory
+from src.hex_geometry import HexGeometry
 
 class Organism:
     MINIMUM_STIMULATION_COUNT = 40
     MINIMUM_REPRODUCTION_HEALTH = 200
 
-    def __init__(self, world, cellular_body, position, genome=None):
-        body_def = Box2D.b2BodyDef()
-        body_def.type = Box2D.b2_dynamicBody
-        body_def.position = position
-        self.body = world.CreateBody(body_def)
+    __slots__ = (
+        'body', 'cellular_body', '_genome', '_local_cell_centers',
+        'cell_fixtures', 'previous_position', 'previous_angle', '_genome_color',
+        'entity_id', 'registry_index',
+    )
+
+    def __init__(self, world, cellular_body, position, genome=None, body_pool=None):
+        if body_pool is not None:
+            self.body = body_pool.acquire(position)
+        else:
+            body_def = Box2D.b2BodyDef()
+            body_def.type = Box2D.b2_dynamicBody
+            body_def.position = position
+            self.body = world.CreateBody(body_def)
         self.cellular_body = cellular_body
         self._genome = genome
-        self.fixtures_need_update = False  # Track if fixtures need recreation
-        self._last_cell_positions = None  # Cache to detect movement
-
+        # Hashing the genome string is slow, and the genome never changes
+        self._genome_color = None
+        self._local_cell_centers = None
+        # Set by the EntityRegistry that holds this organism
+        self.entity_id = None
+        self.registry_index = None
+
+        # One fixture per cell, so a moving cell only reshapes its own fixture
+        self.cell_fixtures = {}
         for cell in self.cells():
-            vertices = self.box2d_cell_vertices(cell)
-            hexagon_shape = Box2D.b2PolygonShape(vertices=vertices)
-            self.body.CreateFixture(shape=hexagon_shape, density=1.0)
+            self.cell_fixtures[cell] = self._create_cell_fixture(cell)
+        self.body.ResetMassData()
 
-        # Store initial positions
-        self._update_position_cache()
+        self.save_transform()
 
     def cells(self):
         return self.cellular_body.cells
 
     def update_clock(self):
         self.cellular_body.update_clock()
-
-        # Check if any cell positions have changed
-        if self._have_cells_moved():
-            self.fixtures_need_update = True
-
-        # Only update fixtures if they actually need updating
-        if self.fixtures_need_update:
-            self.update_fixtures()
-            self.fixtures_need_update = False
-
-    def update_fixtures(self):
-        """Recreate all fixtures based on current cell positions."""
+        self.update_moved_cell_fixtures()
+
+    def update_moved_cell_fixtures(self):
+        # Only reshape fixtures for cells that actually moved this tick
+        moved_cells = self.cellular_body.take_moved_cells()
+        if moved_cells:
+            self.update_cell_fixtures(moved_cells)
+
+    def _create_cell_fixture(self, cell):
+        hexagon_shape = Box2D.b2PolygonShape(vertices=self.box2d_cell_vertices(cell))
+        # Density is set after creation so mass data is computed once per batch, not per fixture
+        fixture = self.body.CreateFixture(
+            shape=hexagon_shape,
+            density=0.0,
+            categoryBits=CollisionCategory.ORGANISM,
+            maskBits=CollisionCategory.ORGANISM_MASK
+        )
+        fixture.density = 1.0
+        return fixture
+
+    def update_cell_fixtures(self, cells):
+        """Reshape the fixtures of the given cells in place, then recompute mass data once."""
+        self._local_cell_centers = None
         try:
-            # Remove all existing fixtures (collect first to avoid iterator invalidation)
-            fixtures_to_destroy = list(self.body.fixtures)
-            for fixture in fixtures_to_destroy:
-                self.body.DestroyFixture(fixture)
-
-            # Create new fixtures based on current cell positions
-            for cell in self.cells():
-                vertices = self.box2d_cell_vertices(cell)
-                hexagon_shape = Box2D.b2PolygonShape(vertices=vertices)
-                self.body.CreateFixture(shape=hexagon_shape, density=1.0)
+            for cell in cells:
+                self.cell_fixtures[cell].shape.vertices = self.box2d_cell_vertices(cell)
         except AssertionError as e:
-            print(f"WARNING: Box2D fixture update failed: {e}")
-            print(f"  Organism health: {self.health()}")
-            print(f"  Living cells: {sum(1 for cell in self.cells() if cell.is_alive())} / {len(self.cells())}")
-            print(f"  Cell positions: {[(cell.q, cell.r, cell.s) for cell in self.cells()]}")
-            print(f"  Fixtures before update: {len(fixtures_to_destroy)}")
-            print(f"  Organism Box2D position: ({self.body.position.x:.1f}, {self.body.position.y:.1f})")
-
-            # Convert hex positions to world coordinates
-            world_positions = []
-            for cell in self.cells():
-                world_x = (3/2 * cell.q) * cell.radius
-                world_y = (math.sqrt(3)/2 * cell.q + math.sqrt(3) * cell.r) * cell.radius
-                world_positions.append((world_x, world_y))
-            print(f"  Cell world coordinates: {world_positions}")
-
-            print(f"  Organism genome: {self.genome()[:20]}...")
-            print("  Organism may not have proper physics.")
+            self._report_fixture_failure(e)
+        self.body.ResetMassData()
+        # A sleeping body doesn't refresh its broadphase bounds, so wake it up
+        self.body.awake = True
+
+    def _report_fixture_failure(self, e):
+        print(f"WARNING: Box2D fixture update failed: {e}")
+        print(f"  Organism health: {self.health()}")
+        print(f"  Living cells: {sum(1 for cell in self.cells() if cell.is_alive())} / {len(self.cells())}")
+        print(f"  Cell positions: {[(cell.q, cell.r, cell.s) for cell in self.cells()]}")
+        print(f"  Fixtures: {len(self.body.fixtures)}")
+        print(f"  Organism Box2D position: ({self.body.position.x:.1f}, {self.body.position.y:.1f})")
+
+        # Convert hex positions to world coordinates
+        world_positions = [HexGeometry.center(cell.q, cell.r, cell.radius) for cell in self.cells()]
+        print(f"  Cell world coordinates: {world_positions}")
+
+        print(f"  Organism genome: {self.genome()[:20]}...")
+        print("  Organism may not have proper physics.")
 
     def box2d_cell_vertices(self, cell):
         """Calculate vertices for a cell's hexagon in Box2D local coordinates."""
-        vertices = []
-        for i in range(6):
-            angle = (math.pi / 3) * i
-            x = ((3/2 * cell.q) * cell.radius) + cell.radius * math.cos(angle)
-            y = ((math.sqrt(3)/2 * cell.q + math.sqrt(3) * cell.r) * cell.radius) + cell.radius * math.sin(angle)
-            vertices.append((x, y))
-        return vertices
+        return HexGeometry.vertices(cell.q, cell.r, cell.radius)
+
+    def local_cell_centers(self):
+        """Cell centers in body coordinates as an (n, 2) array, rebuilt only after cells move."""
+        if self._local_cell_centers is None:
+            self._local_cell_centers = np.array(
+                [HexGeometry.center(cell.q, cell.r, cell.radius) for cell in self.cells()],
+                dtype=float
+            ).reshape(-1, 2)
+        return self._local_cell_centers
+
+    def save_transform(self):
+        """Remember the current body transform so rendering can interpolate from it."""
+        self.previous_position = (self.body.position.x, self.body.position.y)
+        self.previous_angle = self.body.angle
+
+    def interpolated_transform(self, alpha):
+        """Body transform blended between the saved transform (0.0) and the current one (1.0)."""
+        if alpha >= 1.0:
+            return self.body.transform
+
+        previous_x, previous_y = self.previous_position
+        position = self.body.position
+
+        transform = Box2D.b2Transform()
+        transform.position = (
+            previous_x + (position.x - previous_x) * alpha,
+            previous_y + (position.y - previous_y) * alpha
+        )
+        transform.angle = self.previous_angle + (self.body.angle - self.previous_angle) * alpha
+        return transform
 
     def nourish(self):
         for cell in self.cells():
             cell.nourish()
 
     def is_alive(self):
-        return any(cell.is_alive() for cell in self.cells())
+        return self.cellular_body.is_alive()
 
     def genome(self):
         if self._genome:
@@ -96,7 +140,7 @@ class Organism:
             return "".join(cell.gene.value for cell in self.cells())
 
     def stimulation_count(self):
-        return sum(cell.stimulation_count for cell in self.cells())
+        return self.cellular_body.stimulation_count()
 
     def can_reproduce(self):
         return self.stimulation_count() >= self.MINIMUM_STIMULATION_COUNT and self.can_afford_reproduction()
@@ -105,7 +149,7 @@ class Organism:
         return self.health() >= self.MINIMUM_REPRODUCTION_HEALTH
 
     def health(self):
-        return sum(cell.health for cell in self.cells())
+        return self.cellular_body.health()
 
     def subtract_reproduction_cost(self):
         for cell in self.cells():
@@ -113,21 +157,6 @@ class Organism:
 
     def genome_color(self):
         """Get a color based on the genome checksum for visual identification."""
-        return Color.from_genome(self.genome())
-
-    def _update_position_cache(self):
-        """Cache current cell positions for movement detection."""
-        self._last_cell_positions = [(cell.q, cell.r, cell.s) for cell in self.cells()]
-
-    def _have_cells_moved(self):
-        """Check if any cells have moved since last update."""
-        if self._last_cell_positions is None:
-            return True
-
-        current_positions = [(cell.q, cell.r, cell.s) for cell in self.cells()]
-
-        if current_positions != self._last_cell_positions:
-            self._update_position_cache()  # Update cache with new positions
-            return True
-
-        return False
+        if self._genome_color is None:
+            self._genome_color = Color.from_genome(self.genome())
+        return self._genome_color
@@ -1,10 +1,14 @@
+import math
 from .screen import Screen
+from .hex_geometry import HexGeometry
 
 class OrganismRendering:
-    def __init__(self, organism, screen, camera):
+    def __init__(self, organism, screen, camera, alpha=1.0):
         self.organism = organism
         self.screen = screen
         self.camera = camera
+        # Interpolation between the last two physics steps (1.0 is the latest step)
+        self.alpha = alpha
 
     def cell_renderings(self):
         return self._cell_renderings_with_offset(0, 0)
@@ -13,6 +17,8 @@ class OrganismRendering:
         """Generate cell renderings with optional world coordinate offset."""
         cell_renderings = []
         world_vertices = self.vertices()
+        cells = self.organism.cells()
+        border_color = self.organism.genome_color()
 
         for i, fixture_vertices in enumerate(world_vertices):
             screen_vertices = []
@@ -28,10 +34,8 @@ class OrganismRendering:
                 screen_vertices.append((pixel_x, pixel_y))
 
             # Get the corresponding cell for colors
-            if i < len(self.organism.cells()):
-                cell = self.organism.cells()[i]
-                # Get base colors
-                border_color = self.organism.genome_color()
+            if i < len(cells):
+                cell = cells[i]
                 fill_color = cell.fill_color
 
                 # Apply health-based fading
@@ -47,18 +51,21 @@ class OrganismRendering:
 
     def vertices(self):
         """Get all organism vertices in world coordinates (no camera transformation)."""
-        all_vertices = []
-        # Get vertices directly from Box2D fixtures
-        for fixture in self.organism.body.fixtures:
-            shape = fixture.shape
-            fixture_vertices = []
-
-            # Transform each vertex from local to world coordinates
-            for vertex in shape.vertices:
-                world_vertex = self.organism.body.transform * vertex
-                fixture_vertices.append((world_vertex.x, world_vertex.y))
+        transform = self.organism.interpolated_transform(self.alpha)
+        position_x, position_y = transform.position
+        cos_angle = math.cos(transform.angle)
+        sin_angle = math.sin(transform.angle)
 
-            all_vertices.append(fixture_vertices)
+        all_vertices = []
+        for cell in self.organism.cells():
+            # Transform each cached local vertex to world coordinates
+            cell_vertices = []
+            for local_x, local_y in HexGeometry.vertices(cell.q, cell.r, cell.radius):
+                world_x = position_x + cos_angle * local_x - sin_angle * local_y
+                world_y = position_y + sin_angle * local_x + cos_angle * local_y
+                cell_vertices.append((world_x, world_y))
+
+            all_vertices.append(cell_vertices)
         return all_vertices
 
     def bounding_rectangle(self):
@@ -97,7 +104,12 @@ class OrganismRendering:
 
     def _get_wrap_offsets(self, world_width, world_height):
         """Calculate all wrap offsets needed for ghost organisms."""
-        min_x, min_y, max_x, max_y = self.bounding_rectangle()
+        return self.wrap_offsets(self.bounding_rectangle(), world_width, world_height)
+
+    @staticmethod
+    def wrap_offsets(bounding_rectangle, world_width, world_height):
+        """Offsets to draw ghosts at for a bounding rectangle that crosses the world's edges."""
+        min_x, min_y, max_x, max_y = bounding_rectangle
 
         wrap_offsets = []
         wrap_left = min_x < 0
@@ -156,9 +168,9 @@ class OrganismRendering:
 
         return ghost_renderings
 
-    def is_completely_outside_world(self, world_width, world_height):
+    def is_completely_outside_world(self, world_width, world_height, bounding_rectangle=None):
         """Check if organism's bounding rectangle is completely outside world bounds."""
-        min_x, min_y, max_x, max_y = self.bounding_rectangle()
+        min_x, min_y, max_x, max_y = bounding_rectangle or self.bounding_rectangle()
 
         # Check if completely outside on any side
         completely_left = max_x < 0
@@ -170,14 +182,15 @@ class OrganismRendering:
 
     def get_wrap_position(self, world_width, world_height):
         """Get the wrapped position for toroidal teleportation."""
-        if not self.is_completely_outside_world(world_width, world_height):
+        bounding_rectangle = self.bounding_rectangle()
+        if not self.is_completely_outside_world(world_width, world_height, bounding_rectangle):
             return None
 
         current_x, current_y = self.organism.body.position
         new_x, new_y = current_x, current_y
 
         # Wrap position based on which side we exited
-        min_x, min_y, max_x, max_y = self.bounding_rectangle()
+        min_x, min_y, max_x, max_y = bounding_rectangle
 
         if max_x < 0:  # Completely left
             new_x += world_width
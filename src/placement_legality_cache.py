@@ -0,0 +1,54 @@
+class PlacementLegalityCache:
+    """
+    Decides whether a genome's body would be legal from its cell placement
+    deltas alone, before any Cell is built. Each delta is a step to a
+    neighboring hex or no step at all, so the cells always form a
+    contiguous chain with valid coordinates; the body is legal exactly when
+    no two cells land on the same hex.
+    """
+
+    MAX_SIZE = 100000
+
+    def __init__(self, max_size=None):
+        self.max_size = max_size or self.MAX_SIZE
+        # Tuple of placement deltas -> legal
+        self.entries = {}
+        self.hits = 0
+        self.misses = 0
+
+    def __len__(self):
+        return len(self.entries)
+
+    def is_legal(self, placement_deltas):
+        key = tuple(placement_deltas)
+        legal = self.entries.get(key)
+        if legal is not None:
+            self.hits += 1
+            return legal
+
+        self.misses += 1
+        legal = self.positions_are_distinct(key)
+        if len(self.entries) >= self.max_size:
+            # Cheaper than LRU bookkeeping; the common body plans come straight back
+            self.entries.clear()
+        self.entries[key] = legal
+        return legal
+
+    @staticmethod
+    def positions_are_distinct(placement_deltas):
+        """Whether the cells, placed by adding up the deltas as CellSequence does, all land on different hexes."""
+        q, r, s = placement_deltas[0]
+        positions = {(q, r, s)}
+        for dq, dr, ds in placement_deltas[1:]:
+            q, r, s = q + dq, r + dr, s + ds
+            if (q, r, s) in positions:
+                return False
+            positions.add((q, r, s))
+        return True
+
+    def stats(self):
+        return {
+            'hits': self.hits,
+            'misses': self.misses,
+            'size': len(self.entries),
+        }
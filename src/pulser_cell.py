@@ -2,17 +2,23 @@ from src.cell import Cell
 
 class PulserCell(Cell):
     PULSE_HEALTH_COST = 20
+    DEFAULT_PULSE_INTERVAL = 20
 
-    def __init__(self, position, radius, border_color, fill_color, movement_deltas):
+    __slots__ = ()
+
+    def __init__(self, position, radius, border_color, fill_color, movement_deltas, gene=None):
         super().__init__(position, radius, border_color, fill_color, movement_deltas)
-        self.original_fill_color = fill_color
+        self.store.set_pulse_interval(self.row, self.DEFAULT_PULSE_INTERVAL)
+        if gene is not None:
+            self.gene = gene
 
-    def update_clock(self):
+    @Cell.gene.setter
+    def gene(self, gene):
+        Cell.gene.fset(self, gene)
         # Use the genetically determined pulse interval
-        # gene attribute will be set by CellBuilder after creation
-        pulse_interval = self.gene.pulse_interval() if hasattr(self, 'gene') else 20
+        self.store.set_pulse_interval(self.row, gene.pulse_interval())
 
-        if self.clock_tick_count % pulse_interval == 0 and self.is_alive():
-            self.stimulate()
-            self.health -= self.PULSE_HEALTH_COST
-        super().update_clock()
+    def pulse(self):
+        """Called by the CellStore when the clock reaches a multiple of the pulse interval."""
+        self.stimulate()
+        self.health -= self.PULSE_HEALTH_COST
@@ -0,0 +1,33 @@
+import Box2D
+from src.food_morsel import FoodMorsel
+from src.organism import Organism
+
+class RectQuery(Box2D.b2QueryCallback):
+    """
+    Collects the organisms and food morsels whose fixtures' bounding boxes
+    overlap a world rectangle, using the Box2D broadphase through
+    world.QueryAABB. Bodies lead back to their entity through body.userData.
+    """
+
+    def __init__(self, world):
+        Box2D.b2QueryCallback.__init__(self)
+        self.world = world
+        self.organisms = {}  # Organism -> None; a dict keeps them unique and in the order found
+        self.food_morsels = []
+
+    def query(self, min_x, min_y, max_x, max_y):
+        """Return (organisms, food morsels) overlapping the rectangle."""
+        self.organisms = {}
+        self.food_morsels = []
+        aabb = Box2D.b2AABB(lowerBound=(min_x, min_y), upperBound=(max_x, max_y))
+        self.world.QueryAABB(self, aabb)
+        return list(self.organisms), self.food_morsels
+
+    def ReportFixture(self, fixture):
+        entity = fixture.body.userData
+        if isinstance(entity, Organism):
+            self.organisms[entity] = None
+        elif isinstance(entity, FoodMorsel):
+            self.food_morsels.append(entity)
+        # Keep going; every overlapping fixture is wanted
+        return True
@@ -0,0 +1,131 @@
+import numpy as np
+from .screen import Screen
+from .hex_geometry import HexGeometry
+from .organism_rendering import OrganismRendering
+
+class RenderSnapshot:
+    """
+    Every organism's cell hexagons in world coordinates, transformed in one
+    NumPy batch along with each organism's bounding rectangle. Wrap ghosts
+    and the copies drawn in each tile of the wrapped world are translations
+    of those vertices, so nothing is transformed more than once per frame.
+    """
+
+    UNIT_HEXAGON = np.array(HexGeometry.UNIT_HEXAGON)
+
+    def __init__(self, organisms, world_width, world_height, alpha=1.0):
+        self.organisms = [organism for organism in organisms if organism.cells()]
+        self.world_width = world_width
+        self.world_height = world_height
+        self.indices = {organism: index for index, organism in enumerate(self.organisms)}
+        self._colors = None
+        self._wrap_offsets = {}
+
+        if not self.organisms:
+            self.vertices = np.empty((0, 6, 2))
+            self.bounding_rectangles = np.empty((0, 4))
+            self.cell_starts = np.zeros(1, dtype=np.intp)
+            return
+
+        local_centers = []
+        cell_counts = []
+        radii = []
+        poses = []
+        for organism in self.organisms:
+            local_centers.append(organism.local_cell_centers())
+            cell_counts.append(len(organism.cells()))
+            radii.extend(cell.radius for cell in organism.cells())
+            transform = organism.interpolated_transform(alpha)
+            poses.append((transform.position[0], transform.position[1], transform.angle))
+        self.cell_starts = np.concatenate(([0], np.cumsum(cell_counts)))
+
+        # Hexagon corners in body coordinates, then into the world in one batch
+        owners = np.repeat(np.arange(len(self.organisms)), cell_counts)
+        local_vertices = np.concatenate(local_centers)[:, None, :] + np.array(radii)[:, None, None] * self.UNIT_HEXAGON
+        poses = np.array(poses)[owners]
+        cos_angles = np.cos(poses[:, 2])[:, None]
+        sin_angles = np.sin(poses[:, 2])[:, None]
+        self.vertices = np.empty_like(local_vertices)
+        self.vertices[:, :, 0] = poses[:, 0][:, None] + cos_angles * local_vertices[:, :, 0] - sin_angles * local_vertices[:, :, 1]
+        self.vertices[:, :, 1] = poses[:, 1][:, None] + sin_angles * local_vertices[:, :, 0] + cos_angles * local_vertices[:, :, 1]
+
+        cell_minimums = self.vertices.min(axis=1)
+        cell_maximums = self.vertices.max(axis=1)
+        starts = self.cell_starts[:-1]
+        self.bounding_rectangles = np.concatenate(
+            (np.minimum.reduceat(cell_minimums, starts), np.maximum.reduceat(cell_maximums, starts)),
+            axis=1
+        )
+
+    def wrap_positions(self):
+        """(organism, wrapped position) for each organism that has left the world completely."""
+        min_x, min_y, max_x, max_y = self.bounding_rectangles.T
+        shift_x = np.where(max_x < 0, self.world_width, np.where(min_x > self.world_width, -self.world_width, 0.0))
+        shift_y = np.where(max_y < 0, self.world_height, np.where(min_y > self.world_height, -self.world_height, 0.0))
+
+        wrap_positions = []
+        for index in np.flatnonzero((shift_x != 0) | (shift_y != 0)).tolist():
+            organism = self.organisms[index]
+            current_x, current_y = organism.body.position
+            wrap_positions.append((organism, (current_x + shift_x[index], current_y + shift_y[index])))
+        return wrap_positions
+
+    def _cell_colors(self):
+        """Fill and border color of every cell, worked out once per snapshot."""
+        if self._colors is None:
+            fill_colors = []
+            border_colors = []
+            for organism in self.organisms:
+                border_color = organism.genome_color()
+                for cell in organism.cells():
+                    fill_colors.append(cell.get_health_faded_color(cell.fill_color))
+                    border_colors.append(cell.get_health_faded_color(border_color))
+            self._colors = (fill_colors, border_colors)
+        return self._colors
+
+    def _organism_wrap_offsets(self, index):
+        wrap_offsets = self._wrap_offsets.get(index)
+        if wrap_offsets is None:
+            bounding_rectangle = self.bounding_rectangles[index].tolist()
+            wrap_offsets = OrganismRendering.wrap_offsets(bounding_rectangle, self.world_width, self.world_height)
+            self._wrap_offsets[index] = wrap_offsets
+        return wrap_offsets
+
+    def cell_renderings(self, camera, offset_x=0, offset_y=0, organisms=None, ghosts=True):
+        """
+        Cell renderings in pixels for the given organisms (all of them by
+        default), shifted by a world offset. With ghosts, each organism is
+        followed by a copy across every world edge it overlaps. Organisms
+        not in the snapshot are skipped.
+        """
+        if organisms is None:
+            indices = range(len(self.organisms))
+        else:
+            indices = [self.indices[organism] for organism in organisms if organism in self.indices]
+
+        all_fill_colors, all_border_colors = self._cell_colors()
+        cell_indices = []
+        offsets = []
+        fill_colors = []
+        border_colors = []
+        for index in indices:
+            start, end = self.cell_starts[index], self.cell_starts[index + 1]
+            copy_offsets = [(offset_x, offset_y)]
+            if ghosts:
+                copy_offsets.extend((offset_x + wrap_x, offset_y + wrap_y) for wrap_x, wrap_y in self._organism_wrap_offsets(index))
+            for offset in copy_offsets:
+                cell_indices.append(np.arange(start, end))
+                offsets.extend([offset] * (end - start))
+                fill_colors.extend(all_fill_colors[start:end])
+                border_colors.extend(all_border_colors[start:end])
+
+        if not cell_indices:
+            return []
+        polygons = self.vertices[np.concatenate(cell_indices)] + np.array(offsets, dtype=float)[:, None, :]
+
+        screen_x, screen_y = camera.world_to_screen(polygons[:, :, 0], polygons[:, :, 1])
+        pixel_vertices = np.stack((Screen.to_pixels(screen_x), Screen.to_pixels(screen_y)), axis=2).tolist()
+        return [
+            {'vertices': vertices, 'border_color': border_color, 'fill_color': fill_color}
+            for vertices, fill_color, border_color in zip(pixel_vertices, fill_colors, border_colors)
+        ]
@@ -0,0 +1,446 @@
+import Box2D
+import numpy as np
+import random
+import time
+
+from src.genome import Genome
+from src.cell import Cell
+from src.cellular_body_builder import CellularBodyBuilder
+from src.organism import Organism
+from src.render_snapshot import RenderSnapshot
+from src.food_morsel import FoodMorsel
+from src.world_manager import WorldManager
+from src.placement_legality_cache import PlacementLegalityCache
+from src.food_field import FoodField
+from src.contact_listener import ContactListener
+from src.rect_query import RectQuery
+from src.collision_category import CollisionCategory
+
+class Simulation:
+    """The physics and evolution side of the world, with no rendering."""
+
+    WORLD_WIDTH = 120  # meters
+    WORLD_HEIGHT = 120  # meters
+    POPULATION_MAXIMUM = 500
+    ORGANISM_COUNT = POPULATION_MAXIMUM
+
+    STARTING_FOOD_COUNT = 2000  # Seed food to prevent immediate starvation
+    FOOD_INCREMENT = 100  # Add this many food morsels when FPS is healthy
+    FPS_CHECK_INTERVAL = 120  # Check FPS every 2 seconds (120 frames at 60 FPS)
+    REPRODUCTION_INTERVAL = 60  # Process contact events once per second
+
+    TICKS_PER_SECOND = 60  # Simulated rate of cell clocks, independent of rendering
+    PHYSICS_STEP_INTERVAL = 2  # Step the physics every other tick
+    PHYSICS_TIME_STEP = PHYSICS_STEP_INTERVAL / TICKS_PER_SECOND
+
+    MUTATION_RATE = 0.01
+
+    def __init__(self, world=None, organism_count=None, starting_food_count=None, food_field=False, verbose=True):
+        # The world manager owns every body; the lists below are its own, shared
+        self.world_manager = WorldManager(world)
+        self.world = self.world_manager.world
+        self.organisms = self.world_manager.organisms
+        self.food_morsels = self.world_manager.food_morsels
+        # Bodies of dead organisms and eaten food are recycled rather than destroyed
+        self.organism_body_pool = self.world_manager.organism_body_pool
+        self.food_body_pool = self.world_manager.food_body_pool
+        self.world_width = self.WORLD_WIDTH
+        self.world_height = self.WORLD_HEIGHT
+        # Optionally keep food out of Box2D entirely
+        self.food_field = FoodField(self.world_width, self.world_height) if food_field else None
+        self.organism_count = organism_count or self.ORGANISM_COUNT
+        self.starting_food_count = self.STARTING_FOOD_COUNT if starting_food_count is None else starting_food_count
+        self.verbose = verbose
+        # Finds what the viewport can see through the Box2D broadphase
+        self.rect_query = RectQuery(self.world)
+
+        # Most illegal bodies can be turned away from their placement deltas alone
+        self.placement_legality_cache = PlacementLegalityCache()
+        self.body_attempts = {'attempts': 0, 'rejected_before_building': 0, 'built': 0}
+
+        self.frame_count = 0
+        self.run_number = 1
+        self.run_start_time = time.time()
+
+        # Records for most cycles
+        self.run_cycles = 0
+        self.most_cycles = 0
+        self.most_cycles_run = 0
+
+        # Cell count tracking variables
+        self.max_organism_size = 0
+        self.max_organism_size_run = 0
+
+        self.reset_world()
+
+    def log(self, message):
+        if self.verbose:
+            print(message)
+
+    def generate_organisms(self):
+        organisms = []
+        remaining_organisms = self.organism_count
+
+        while remaining_organisms > 0:
+            organisms.append(self.generate_organism())
+            remaining_organisms -= 1
+
+        return organisms
+
+    def generate_organism(self):
+        # Keep trying until we get a legal cellular body
+        while True:
+            genome = Genome()
+            if not self.placement_is_legal(genome.placement_deltas()):
+                continue
+
+            cellular_body_builder = CellularBodyBuilder(genome.cell_genes())
+            cellular_body = cellular_body_builder.cellular_body()
+            self.body_attempts['built'] += 1
+
+            if cellular_body.is_legal():
+                self.log(genome.value())
+                # Generate random position within world bounds
+                x = random.uniform(0, self.world_width)
+                y = random.uniform(0, self.world_height)
+                return Organism(self.world, cellular_body, (x, y), genome, self.organism_body_pool)
+
+            # Discarded bodies have to give their cell rows back
+            cellular_body.release()
+
+    def generate_offspring(self, parent_a_genome, parent_b_genome, position):
+        # Splice and mutate packed genomes; only the result goes back to a string
+        parent_a_bits, parent_a_length = Genome.to_bits(parent_a_genome)
+        parent_b_bits, parent_b_length = Genome.to_bits(parent_b_genome)
+
+        # Keep trying until we get a legal cellular body
+        while True:
+            # Splice parent genomes
+            spliced_bits = Genome.splice_bits(parent_a_bits, parent_a_length, parent_b_bits, parent_b_length)
+
+            # Apply mutations
+            mutated_bits = Genome.mutate_bits(spliced_bits, parent_b_length, self.MUTATION_RATE)
+
+            # Don't build a genome or cells for a body that would overlap itself
+            placement_deltas = Genome.placement_deltas_from_bits(mutated_bits, parent_b_length)
+            if placement_deltas is not None and not self.placement_is_legal(placement_deltas):
+                continue
+
+            # Create offspring genome from mutated string
+            offspring_genome = Genome.from_string(Genome.from_bits(mutated_bits, parent_b_length))
+            cellular_body_builder = CellularBodyBuilder(offspring_genome.cell_genes())
+            cellular_body = cellular_body_builder.cellular_body()
+            self.body_attempts['built'] += 1
+
+            if cellular_body.is_legal():
+                self.log(f"Offspring genome: {offspring_genome.value()}")
+                return Organism(self.world, cellular_body, position, offspring_genome, self.organism_body_pool)
+
+            cellular_body.release()
+
+    def placement_is_legal(self, placement_deltas):
+        """Count an attempt at a body, and whether its placement deltas alone ruled it out."""
+        self.body_attempts['attempts'] += 1
+        if self.placement_legality_cache.is_legal(placement_deltas):
+            return True
+
+        self.body_attempts['rejected_before_building'] += 1
+        return False
+
+    def emigrant_genomes(self, count):
+        """Genome strings of the most stimulated organisms, the likeliest breeders."""
+        organisms = sorted(self.organisms, key=lambda organism: organism.stimulation_count(), reverse=True)
+        return [organism.genome() for organism in organisms[:count]]
+
+    def add_immigrants(self, genome_strings):
+        """Add organisms grown from genome strings, replacing the weakest when full."""
+        for genome_string in genome_strings:
+            genome = Genome.from_string(genome_string)
+            if not self.placement_is_legal(genome.placement_deltas()):
+                continue
+
+            cellular_body = CellularBodyBuilder(genome.cell_genes()).cellular_body()
+            self.body_attempts['built'] += 1
+            if not cellular_body.is_legal():
+                cellular_body.release()
+                continue
+
+            if len(self.organisms) >= self.POPULATION_MAXIMUM:
+                weakest = min(self.organisms, key=lambda organism: organism.health())
+                self.world_manager.remove_organism(weakest)
+                self.contact_listener.remove_organism(weakest)
+
+            x = random.uniform(0, self.world_width)
+            y = random.uniform(0, self.world_height)
+            organism = Organism(self.world, cellular_body, (x, y), genome, self.organism_body_pool)
+            self.world_manager.add_organism(organism)
+
+    def create_food_morsels(self, count=200):
+        food_morsels = []
+        for _ in range(count):
+            x = random.uniform(0, self.world_width)
+            y = random.uniform(0, self.world_height)
+            food_morsel = FoodMorsel(self.world, (x, y), body_pool=self.food_body_pool)
+            food_morsels.append(food_morsel)
+        return food_morsels
+
+    def create_walls(self):
+        thickness = 1.0
+        world_width, world_height = self.world_width, self.world_height
+        wall_fixture = Box2D.b2FixtureDef(
+            categoryBits=CollisionCategory.WALL,
+            maskBits=CollisionCategory.WALL_MASK
+        )
+
+        # Bottom wall
+        bottom_wall = self.world.CreateStaticBody(
+            position=(world_width/2, thickness/2),
+            shapes=Box2D.b2PolygonShape(box=(world_width/2, thickness/2)),
+            shapeFixture=wall_fixture
+        )
+
+        # Top wall
+        top_wall = self.world.CreateStaticBody(
+            position=(world_width/2, world_height - thickness/2),
+            shapes=Box2D.b2PolygonShape(box=(world_width/2, thickness/2)),
+            shapeFixture=wall_fixture
+        )
+
+        # Left wall
+        left_wall = self.world.CreateStaticBody(
+            position=(thickness/2, world_height/2),
+            shapes=Box2D.b2PolygonShape(box=(thickness/2, world_height/2)),
+            shapeFixture=wall_fixture
+        )
+
+        # Right wall
+        right_wall = self.world.CreateStaticBody(
+            position=(world_width - thickness/2, world_height/2),
+            shapes=Box2D.b2PolygonShape(box=(thickness/2, world_height/2)),
+            shapeFixture=wall_fixture
+        )
+
+        for wall in (bottom_wall, top_wall, left_wall, right_wall):
+            self.world_manager.add_wall(wall)
+
+    def reset_world(self):
+        """Clear out the last run's bodies and seed a new one in the same b2World."""
+        self.world_manager.clear()
+
+        for organism in self.generate_organisms():
+            self.world_manager.add_organism(organism)
+
+        if self.food_field is not None:
+            self.food_field.clear()
+            self.food_field.add_random(self.starting_food_count)
+        else:
+            for food_morsel in self.create_food_morsels(self.starting_food_count):
+                self.world_manager.add_food_morsel(food_morsel)
+            # Have the first food top-up ready so it doesn't allocate mid-run
+            self.food_body_pool.reserve(self.FOOD_INCREMENT)
+
+        self.contact_listener = ContactListener()
+        self.world.contactListener = self.contact_listener
+
+    def record_run_cycles(self):
+        """Check if this run had the most cycles."""
+        if self.run_cycles > self.most_cycles:
+            self.most_cycles = self.run_cycles
+            self.most_cycles_run = self.run_number
+            self.log(f"New cycle record: {self.run_cycles} cycles (Run #{self.run_number})")
+
+    def start_next_run(self):
+        """Start a new run at the user's request, keeping the records."""
+        self.record_run_cycles()
+
+        self.run_number += 1
+        self.run_cycles = 0
+        self.run_start_time = time.time()
+        self.reset_world()
+
+    def restart_after_collapse(self):
+        self.log(f"Run #{self.run_number} ended - population fell to {len(self.organisms)} after {self.run_cycles} cycles")
+        self.record_run_cycles()
+
+        self.run_number += 1
+        self.run_cycles = 0
+        self.run_start_time = time.time()
+        self.log(f"Starting Run #{self.run_number}")
+
+        # Reset everything
+        self.reset_world()
+        self.frame_count = 0
+
+        self.log(f"Run #{self.run_number} started with {len(self.organisms)} organisms")
+        self.log(f"Bodies in world: {self.world_manager.body_counts()}")
+        if self.most_cycles > 0:
+            self.log(f"Record cycle count so far: {self.most_cycles} cycles (Run #{self.most_cycles_run})")
+
+    def record_organism_sizes(self):
+        """Calculate average cell count and track max organism size."""
+        if not self.organisms:
+            return
+
+        cell_counts = [len(organism.cells()) for organism in self.organisms]
+        avg_cell_count = sum(cell_counts) / len(cell_counts)
+        current_max = max(cell_counts)
+
+        # Update max organism size record
+        if current_max > self.max_organism_size:
+            self.max_organism_size = current_max
+            self.max_organism_size_run = self.run_number
+
+        self.log(f"Avg cells per organism: {avg_cell_count:.1f}")
+        self.log(f"Biggest organism record: {self.max_organism_size} cells (Run #{self.max_organism_size_run})")
+
+    def reproduce(self):
+        """Breed organisms from the contact events collected since the last call."""
+        for contact_event in self.contact_listener.get_contact_events():
+            organism_a = contact_event['organism_a']
+            organism_b = contact_event['organism_b']
+            position = contact_event['position']
+
+            while organism_a.can_reproduce() and organism_b.can_reproduce() and len(self.organisms) < self.POPULATION_MAXIMUM:
+                organism_a.subtract_reproduction_cost()
+                organism_b.subtract_reproduction_cost()
+
+                offspring = self.generate_offspring(organism_a.genome(), organism_b.genome(), position)
+                self.world_manager.add_organism(offspring)
+
+    def add_food(self):
+        if self.food_field is not None:
+            self.food_field.add_random(self.FOOD_INCREMENT)
+            self.run_cycles += 1
+            return
+
+        for food_morsel in self.create_food_morsels(self.FOOD_INCREMENT):
+            self.world_manager.add_food_morsel(food_morsel)
+        self.run_cycles += 1
+
+    def update_organisms(self):
+        """Update organisms and handle toroidal wrapping."""
+        # Advance every cell's clock in one batch, then reshape whatever moved
+        if self.organisms:
+            Cell.store.update_clock(np.concatenate([organism.cellular_body.cell_rows() for organism in self.organisms]))
+
+        living_organisms = []
+        organisms_to_remove = []
+        for organism in self.organisms:
+            organism.update_moved_cell_fixtures()
+            if organism.is_alive():
+                living_organisms.append(organism)
+            else:
+                organisms_to_remove.append(organism)
+
+        # Wrapping only needs world geometry, so every bounding box comes from one batch
+        snapshot = RenderSnapshot(living_organisms, self.world_width, self.world_height)
+        for organism, wrap_position in snapshot.wrap_positions():
+            # Teleport organism to wrapped position
+            organism.body.position = wrap_position
+            # Don't interpolate across the teleport
+            organism.save_transform()
+
+        for organism in organisms_to_remove:
+            self.world_manager.remove_organism(organism)
+            self.contact_listener.remove_organism(organism)
+
+    def remove_eaten_food(self):
+        # Only the morsels eaten since the last call, so quiet ticks cost nothing
+        for food_morsel in self.contact_listener.take_eaten_food_morsels():
+            self.world_manager.remove_food_morsel(food_morsel)
+
+    def step(self, food_allowed=True):
+        """
+        Advance the simulation by one tick. food_allowed gates the periodic
+        food top-up; the renderer uses it to hold food back when FPS is low.
+        """
+        self.frame_count += 1
+
+        if self.frame_count % self.REPRODUCTION_INTERVAL == 0:
+            self.log("-----------------------")
+            self.log(f"tick: {self.frame_count}")
+            self.record_organism_sizes()
+            self.reproduce()
+
+        if self.frame_count % self.FPS_CHECK_INTERVAL == 0:
+            if food_allowed:
+                self.add_food()
+                self.log(f"Added {self.FOOD_INCREMENT} food morsels (total: {self.food_count()})")
+                self.log(f"Cycle {self.run_cycles} complete")
+            else:
+                self.log("No food added - organisms compete for existing food")
+
+        # Check if population is too low - restart if so
+        if len(self.organisms) < 2:
+            self.restart_after_collapse()
+
+        self.update_organisms()
+        if self.food_field is None:
+            self.remove_eaten_food()
+
+        # Step the physics simulation at 30 FPS for better performance
+        if self.frame_count % self.PHYSICS_STEP_INTERVAL == 0:
+            for organism in self.organisms:
+                organism.save_transform()
+
+            # Organisms only travel across the food field when physics steps
+            if self.food_field is not None:
+                self.food_field.consume(self.organisms)
+
+            self.world.Step(self.PHYSICS_TIME_STEP, 6, 2)  # Double timestep every other tick
+
+    def food_count(self):
+        if self.food_field is not None:
+            return len(self.food_field)
+        return len(self.food_morsels)
+
+    def food_positions(self):
+        """World positions of all uneaten food, whichever way it is stored."""
+        if self.food_field is not None:
+            return self.food_field.positions()
+        return [
+            (food_morsel.body.position.x, food_morsel.body.position.y)
+            for food_morsel in self.food_morsels if not food_morsel.eaten
+        ]
+
+    def entities_in_rect(self, min_x, min_y, max_x, max_y):
+        """
+        Living organisms and uneaten food positions overlapping a rectangle
+        of the world, found through the Box2D broadphase or the food field's
+        grid rather than by checking everything.
+        """
+        organisms, food_morsels = self.rect_query.query(min_x, min_y, max_x, max_y)
+        organisms = [organism for organism in organisms if organism.is_alive()]
+
+        if self.food_field is not None:
+            radius = self.food_field.radius
+            food_positions = self.food_field.positions_in_rect(min_x - radius, min_y - radius, max_x + radius, max_y + radius)
+        else:
+            food_positions = [
+                (food_morsel.body.position.x, food_morsel.body.position.y)
+                for food_morsel in food_morsels if not food_morsel.eaten
+            ]
+        return organisms, food_positions
+
+    def food_radius(self):
+        if self.food_field is not None:
+            return self.food_field.radius
+        return FoodMorsel.RADIUS
+
+    def interpolation_alpha(self, tick_fraction):
+        """
+        Blend factor between the last two physics steps for a frame rendered
+        tick_fraction of the way to the next tick.
+        """
+        ticks_since_physics_step = self.frame_count % self.PHYSICS_STEP_INTERVAL
+        return (ticks_since_physics_step + tick_fraction) / self.PHYSICS_STEP_INTERVAL
+
+    def records(self):
+        return {
+            'run_number': self.run_number,
+            'run_cycles': self.run_cycles,
+            'most_cycles': self.most_cycles,
+            'most_cycles_run': self.most_cycles_run,
+            'max_organism_size': self.max_organism_size,
+            'max_organism_size_run': self.max_organism_size_run,
+        }
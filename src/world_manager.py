@@ -0,0 +1,62 @@
+import Box2D
+from src.body_pool import BodyPool
+from src.entity_registry import EntityRegistry
+
+class WorldManager:
+    """
+    Owns the b2World and every body in it: organisms, food morsels and
+    walls. Organisms and food morsels live in entity registries, which map
+    their bodies back to them through body.userData. Organism and food
+    bodies come from and go back to body pools, so clearing the world
+    between runs reuses both the world and its bodies instead of leaving
+    old ones behind. Removed organisms also free their cells' CellStore
+    rows.
+    """
+
+    def __init__(self, world=None):
+        self.world = world or Box2D.b2World(gravity=(0, 0))
+        self.organism_body_pool = BodyPool(self.world, keep_fixtures=False)
+        self.food_body_pool = BodyPool(self.world)
+        self.organisms = EntityRegistry()
+        self.food_morsels = EntityRegistry()
+        self.walls = []
+
+    def add_organism(self, organism):
+        self.organisms.add(organism)
+
+    def remove_organism(self, organism):
+        # Releasing the body ends its contacts, which still need to find the organism
+        self.organism_body_pool.release(organism.body)
+        self.organisms.remove(organism)
+        organism.cellular_body.release()
+
+    def add_food_morsel(self, food_morsel):
+        self.food_morsels.add(food_morsel)
+
+    def remove_food_morsel(self, food_morsel):
+        self.food_body_pool.release(food_morsel.body)
+        self.food_morsels.remove(food_morsel)
+
+    def add_wall(self, body):
+        self.walls.append(body)
+
+    def clear(self):
+        """Return every organism and food body to its pool. Walls stay, since they never change."""
+        for organism in self.organisms:
+            self.organism_body_pool.release(organism.body)
+            organism.cellular_body.release()
+        for food_morsel in self.food_morsels:
+            self.food_body_pool.release(food_morsel.body)
+
+        self.organisms.clear()
+        self.food_morsels.clear()
+
+    def body_counts(self):
+        """How many bodies the world holds, by owner. 'total' should equal the sum of the rest."""
+        return {
+            'organisms': len(self.organisms),
+            'food': len(self.food_morsels),
+            'walls': len(self.walls),
+            'pooled': len(self.organism_body_pool) + len(self.food_body_pool),
+            'total': self.world.bodyCount,
+        }
@@ -0,0 +1,16 @@
+from src.cell import Cell
+from src.cellular_body import CellularBody
+from src.organism import Organism
+
+class OrganismFactory:
+    RADIUS = 0.4
+
+    def organism(self, world, position, cell_positions=((0, 0, 0),), angle=0.0, genome=None):
+        """An organism with plain cells at the given hex positions, built straight from Cells."""
+        cells = [
+            Cell(cell_position, self.RADIUS, (0, 255, 0), (0, 0, 0), [(0, 0, 0)])
+            for cell_position in cell_positions
+        ]
+        organism = Organism(world, CellularBody(cells), position, genome)
+        organism.body.angle = angle
+        return organism
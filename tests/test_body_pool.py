@@ -0,0 +1,87 @@
+import pytest
+import Box2D
+from src.body_pool import BodyPool
+from src.food_morsel import FoodMorsel
+from src.organism import Organism
+from src.cell import Cell
+from src.cellular_body import CellularBody
+
+def test_acquire_creates_body_when_pool_is_empty():
+    world = Box2D.b2World(gravity=(0, 0))
+    body_pool = BodyPool(world)
+
+    body = body_pool.acquire((3, 4))
+
+    assert world.bodyCount == 1
+    assert body.position.x == 3
+    assert body.position.y == 4
+
+def test_released_body_is_reused():
+    world = Box2D.b2World(gravity=(0, 0))
+    body_pool = BodyPool(world)
+    body = body_pool.acquire((3, 4))
+    body.linearVelocity = (5, 5)
+
+    body_pool.release(body)
+    assert not body.active
+
+    reused_body = body_pool.acquire((7, 8))
+    assert reused_body == body
+    assert reused_body.active
+    assert reused_body.position.x == 7
+    assert reused_body.linearVelocity.x == 0
+    assert world.bodyCount == 1
+
+def test_reserve():
+    world = Box2D.b2World(gravity=(0, 0))
+    body_pool = BodyPool(world)
+
+    body_pool.reserve(10)
+
+    assert len(body_pool) == 10
+    assert not any(body.active for body in world.bodies)
+
+def test_food_morsel_reuses_pooled_fixture():
+    world = Box2D.b2World(gravity=(0, 0))
+    body_pool = BodyPool(world)
+    food_morsel = FoodMorsel(world, (1, 1), body_pool=body_pool)
+    body_pool.release(food_morsel.body)
+
+    new_food_morsel = FoodMorsel(world, (2, 2), body_pool=body_pool)
+
+    assert new_food_morsel.body == food_morsel.body
+    assert len(new_food_morsel.body.fixtures) == 1
+
+def test_organism_gets_fresh_fixtures_on_pooled_body():
+    world = Box2D.b2World(gravity=(0, 0))
+    body_pool = BodyPool(world, keep_fixtures=False)
+    cells = [Cell((0, 0, 0), 1, (0, 255, 0), (0, 0, 0), [(0, 0, 0)]), Cell((1, 0, -1), 1, (0, 255, 0), (0, 0, 0), [(0, 0, 0)])]
+    organism = Organism(world, CellularBody(cells), (5, 5), body_pool=body_pool)
+    body_pool.release(organism.body)
+    assert len(organism.body.fixtures) == 0
+
+    new_cells = [Cell((0, 0, 0), 1, (0, 255, 0), (0, 0, 0), [(0, 0, 0)])]
+    new_organism = Organism(world, CellularBody(new_cells), (6, 6), body_pool=body_pool)
+
+    assert new_organism.body == organism.body
+    assert len(new_organism.body.fixtures) == 1
+    assert world.bodyCount == 1
+
+class CountingBodyPool(BodyPool):
+    def __init__(self, world):
+        super().__init__(world)
+        self.acquired = 0
+
+    def acquire(self, position):
+        self.acquired += 1
+        return super().acquire(position)
+
+def test_empty_pool_is_still_used():
+    world = Box2D.b2World(gravity=(0, 0))
+    body_pool = CountingBodyPool(world)
+    assert len(body_pool) == 0
+
+    FoodMorsel(world, (1, 1), body_pool=body_pool)
+    Organism(world, CellularBody([Cell((0, 0, 0), 0.4, (0, 255, 0), (0, 0, 0), [])]), (5, 5), body_pool=body_pool)
+
+    assert body_pool.acquired == 2
@@ -103,3 +103,23 @@ def test_refractory_period():
         cellular_body.update_clock()
 
     assert cell.stimulation_count == 1
+
+def test_cells_have_no_instance_dict():
+    from src.pulser_cell import PulserCell
+    cell = Cell((0, 0, 0), 1, (0, 0, 0), (0, 0, 0), [(0, 0, 0)])
+    pulser_cell = PulserCell((0, 0, 0), 1, (0, 0, 0), (0, 0, 0), [(0, 0, 0)])
+
+    assert not hasattr(cell, '__dict__')
+    assert not hasattr(pulser_cell, '__dict__')
+
+def test_gene_passed_to_constructor():
+    from src.cell_gene import CellGene
+    from src.pulser_cell import PulserCell
+
+    # Pulse interval bits 0010011 = 19, +1 = 20; propagation delay bits 001 = 1, +1 = 2
+    gene = CellGene('000000000000110010011001')
+    pulser_cell = PulserCell((0, 0, 0), 1, (0, 0, 0), (0, 0, 0), [(0, 0, 0)], gene)
+
+    assert pulser_cell.gene is gene
+    assert pulser_cell.store.pulse_interval[pulser_cell.row] == 20
+    assert pulser_cell.store.propagation_delay[pulser_cell.row] == 2
@@ -1,6 +1,7 @@
 import pytest
 
 from src.cell_gene import CellGene
+from src.genome import Genome
 from tests.cell_gene_factory import CellGeneFactory
 
 def test_cell_gene_initialization():
@@ -31,3 +32,27 @@ def test_cell_type():
     assert f.cell(cell_type_gene="01").cell_type() == "default"
     assert f.cell(cell_type_gene="10").cell_type() == "default"
     assert f.cell(cell_type_gene="11").cell_type() == "pulser"
+
+def test_identical_genes_share_one_phenotype():
+    # Pulse interval bits 0010011 = 19, +1 = 20; propagation delay bits 001 = 1, +1 = 2
+    gene = CellGene("011000000000110010011001")
+    same_gene = CellGene("011000000000110010011001")
+
+    assert gene.phenotype is same_gene.phenotype
+    assert gene.placement_delta() == (1, 0, -1)
+    assert gene.cell_type() == "pulser"
+    assert gene.pulse_interval() == 20
+    assert gene.stimulation_propagation_delay() == 2
+
+def test_phenotype_table_stays_bounded():
+    for _ in range(CellGene.MAX_PHENOTYPES + 10):
+        CellGene.random().cell_type()
+
+    assert len(CellGene._phenotypes) <= CellGene.MAX_PHENOTYPES
+
+def test_genes_are_decoded_only_when_used():
+    genome = Genome()
+    for cell_gene in genome.cell_genes():
+        cell_gene.placement_delta()
+
+    assert all(cell_gene._phenotype is None for cell_gene in genome._cell_genes[genome.effective_cell_count():])
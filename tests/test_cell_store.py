@@ -0,0 +1,115 @@
+import pytest
+from src.cell_store import CellStore
+from src.cell import Cell
+from src.pulser_cell import PulserCell
+from src.cellular_body import CellularBody
+from src.cell_gene import CellGene
+
+def test_allocate_grows_and_reuses_freed_rows():
+    cell_store = CellStore(capacity=2)
+
+    rows = [cell_store.allocate(None) for _ in range(3)]
+    assert len(set(rows)) == 3
+    assert cell_store.capacity == 4
+
+    cell_store.health[rows[0]] = 10
+    cell_store.free([rows[0]])
+    assert len(cell_store) == 2
+
+    reused_row = cell_store.allocate(None)
+    assert reused_row == rows[0]
+    assert cell_store.health[reused_row] == 0
+
+def test_cell_is_a_view_over_its_row():
+    cell = Cell((0, 0, 0), 1, (0, 0, 0), (0, 0, 0), [(0, 0, 0)])
+
+    cell.health = 123
+    assert Cell.store.health[cell.row] == 123
+    assert cell.health == 123
+
+def test_batch_update_matches_updating_cells_one_at_a_time():
+    def build_body():
+        cells = [
+            PulserCell((0, 0, 0), 1, (0, 0, 0), (0, 0, 0), [(0, 0, 0)]),
+            Cell((0, 1, -1), 1, (0, 0, 0), (0, 0, 0), [(0, 0, 0)]),
+            Cell((1, 0, -1), 1, (0, 0, 0), (0, 0, 0), [(0, 0, 0)]),
+        ]
+        for cell in cells:
+            cell.gene = CellGene('000000000000000000000001')
+        return CellularBody(cells)
+
+    batched_body = build_body()
+    single_body = build_body()
+
+    for _ in range(100):
+        batched_body.update_clock()
+        for cell in single_body.cells:
+            cell.update_clock()
+
+    for batched_cell, single_cell in zip(batched_body.cells, single_body.cells):
+        assert batched_cell.stimulation_count == single_cell.stimulation_count
+        assert batched_cell.health == single_cell.health
+    assert batched_body.stimulation_count() > 0
+
+def test_release_frees_rows():
+    cellular_body = CellularBody([
+        Cell((0, 0, 0), 1, (0, 0, 0), (0, 0, 0), [(0, 0, 0)]),
+        Cell((0, 1, -1), 1, (0, 0, 0), (0, 0, 0), [(0, 0, 0)]),
+    ])
+    rows_in_use = len(Cell.store)
+
+    cellular_body.release()
+
+    assert len(Cell.store) == rows_in_use - 2
+
+def test_stimulation_events_are_scheduled_on_the_wheel():
+    cell_store = Cell.store
+    cell = Cell((0, 0, 0), 1, (0, 0, 0), (0, 0, 0), [(0, 0, 0)])
+
+    cell.stimulate()
+
+    assert cell_store.show_stimulation_tick[cell.row] == cell_store.tick + 1
+    assert cell_store.unstimulate_tick[cell.row] == cell_store.tick + 1 + Cell.STIMULATION_DURATION
+    assert cell.row in cell_store.wheels['unstimulate_tick'][cell_store.unstimulate_tick[cell.row] % CellStore.WHEEL_SIZE]
+
+def test_countdowns_freeze_while_a_cell_misses_ticks():
+    cell = Cell((0, 0, 0), 1, (0, 0, 0), (0, 0, 0), [(0, 0, 0)])
+    other_cell = Cell((5, 0, -5), 1, (0, 0, 0), (0, 0, 0), [(0, 0, 0)])
+
+    cell.stimulate()
+    cell.update_clock()
+    assert cell.fill_color == Cell.STIMULATION_COLOR
+
+    # Ticks spent on other cells don't count down this one's stimulation
+    for _ in range(Cell.STIMULATION_DURATION * 2):
+        other_cell.update_clock()
+    assert cell.fill_color == Cell.STIMULATION_COLOR
+
+    for _ in range(Cell.STIMULATION_DURATION):
+        cell.update_clock()
+    assert cell.fill_color == cell.original_fill_color
+
+def propagate_at_refractory_boundary(propagating_cell_index):
+    """Stimulate one cell of a pair so it propagates to the other just as that one's refractory period ends."""
+    cells = [
+        Cell((0, 0, 0), 1, (0, 0, 0), (0, 0, 0), []),
+        Cell((0, 1, -1), 1, (0, 0, 0), (0, 0, 0), []),
+    ]
+    cellular_body = CellularBody(cells)
+    propagating_cell = cells[propagating_cell_index]
+    neighbor = cells[1 - propagating_cell_index]
+
+    propagating_cell.stimulate()
+    propagation_clock = Cell.STIMULATION_DURATION - 1 + Cell.DEFAULT_PROPAGATION_DELAY
+    # The neighbor's clock reads propagation_clock after this tick's increment
+    neighbor.last_stimulation_tick = propagation_clock - Cell.REFRACTORY_PERIOD
+    for _ in range(propagation_clock):
+        cellular_body.update_clock()
+    return neighbor.stimulation_count
+
+def test_propagation_to_a_later_cell_uses_its_clock_from_before_the_tick():
+    # Cells once ticked in body order, so the later cell hadn't counted this tick yet
+    assert propagate_at_refractory_boundary(0) == 0
+
+def test_propagation_to_an_earlier_cell_uses_its_clock_from_after_the_tick():
+    assert propagate_at_refractory_boundary(1) == 1
@@ -93,3 +93,50 @@ def test_illegal_move_gap():
     cellular_body = CellularBody([cell, mover_cell])
     cellular_body.respond_to_cell_stimulation(mover_cell)
     assert mover_cell.position == (0, -1, 1)
+
+def test_position_index_follows_moves():
+    cell = Cell((0, 0, 0), 1, (0, 0, 0), (0, 0, 0), [(0, 0, 0)])
+    other_cell = Cell((0, 1, -1), 1, (0, 0, 0), (0, 0, 0), [(0, 0, 0)])
+    cellular_body = CellularBody([cell, other_cell])
+
+    other_cell.move((0, -1, 1))
+    assert cellular_body.contains_overlaps()
+
+    other_cell.move((1, -1, 0))
+    assert not cellular_body.contains_overlaps()
+    assert cellular_body.cells_by_position[(0, 0, 0)] is cell
+    assert cellular_body.cells_by_position[(1, -1, 0)] is other_cell
+    assert cellular_body.neighbors(cell) == [other_cell]
+
+def test_is_legal_move_agrees_with_checking_a_moved_copy():
+    import copy
+    import random
+    from src.genome import Genome
+    from src.cell_gene import CellGene
+    from src.cellular_body_builder import CellularBodyBuilder
+
+    random.seed(12)
+    gene_length = sum(CellGene.GENE_SECTION_LENGTHS.values())
+    genome_length = Genome.cell_count_prefix_length() + Genome.MAX_CELL_COUNT * gene_length
+    cell_counts = []
+    while len(cell_counts) < 30:
+        # A random prefix gives bodies of 3 to 16 cells, so the arc check and the BFS fallback both run
+        genome = Genome.from_string("".join(random.choice("01") for _ in range(genome_length)))
+        if genome.effective_cell_count() < 3:
+            continue
+        cellular_body = CellularBodyBuilder(genome.cell_genes()).cellular_body()
+        if not cellular_body.is_legal():
+            cellular_body.release()
+            continue
+        cell_counts.append(len(cellular_body.cells))
+
+        for i, cell in enumerate(cellular_body.cells):
+            for delta in CellGene.LEGAL_DELTAS:
+                test_cells = copy.deepcopy(cellular_body.cells)
+                test_cells[i].move(delta)
+                moved_body = CellularBody(test_cells)
+                assert cellular_body.is_legal_move(cell, delta) == moved_body.is_legal()
+                moved_body.release()
+        cellular_body.release()
+
+    assert max(cell_counts) >= 6
@@ -0,0 +1,39 @@
+import pytest
+import Box2D
+from src.collision_category import CollisionCategory
+from src.food_morsel import FoodMorsel
+from src.simulation import Simulation
+from tests.organism_factory import OrganismFactory
+
+class CountingContactListener(Box2D.b2ContactListener):
+    def __init__(self):
+        Box2D.b2ContactListener.__init__(self)
+        self.pairs = []
+
+    def BeginContact(self, contact):
+        self.pairs.append((contact.fixtureA.filterData.categoryBits, contact.fixtureB.filterData.categoryBits))
+
+def test_food_only_contacts_organisms():
+    world = Box2D.b2World(gravity=(0, 0))
+    listener = CountingContactListener()
+    world.contactListener = listener
+
+    # Two overlapping morsels, and a third overlapping an organism
+    FoodMorsel(world, (10, 10))
+    FoodMorsel(world, (10.1, 10))
+    FoodMorsel(world, (20, 20))
+    OrganismFactory().organism(world, (20.2, 20))
+
+    world.Step(1.0 / 60, 6, 2)
+
+    assert sorted(sorted(pair) for pair in listener.pairs) == [[CollisionCategory.ORGANISM, CollisionCategory.FOOD]]
+
+def test_walls_only_contact_organisms():
+    simulation = Simulation(organism_count=2, starting_food_count=0, verbose=False)
+    simulation.create_walls()
+
+    for body in simulation.world.bodies:
+        if body.type == Box2D.b2_staticBody:
+            filter_data = body.fixtures[0].filterData
+            assert filter_data.categoryBits == CollisionCategory.WALL
+            assert filter_data.maskBits == CollisionCategory.ORGANISM
@@ -0,0 +1,17 @@
+import pytest
+from src.color import Color
+
+def test_faded_color_at_full_and_no_health():
+    assert Color.faded(Color.RED, 1.0) == Color.RED
+    assert Color.faded(Color.RED, 0.0) == Color.GHOST_GRAY
+
+def test_faded_color_is_quantized_and_shared():
+    first = Color.faded(Color.BLUE, 0.5)
+    nearby = Color.faded(Color.BLUE, 0.5 + 0.1 / Color.HEALTH_FADE_STEPS)
+
+    assert first is nearby
+    assert first == (100, 100, 227)
+
+def test_from_genome_is_stable():
+    assert Color.from_genome("0101") == Color.from_genome("0101")
+    assert Color.from_genome("0101") in Color.PALETTE
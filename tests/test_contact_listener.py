@@ -0,0 +1,70 @@
+import pytest
+import Box2D
+from src.contact_listener import ContactListener
+from src.entity_registry import EntityRegistry
+from src.food_morsel import FoodMorsel
+from tests.organism_factory import OrganismFactory
+
+CELL_POSITIONS = [(0, 0, 0), (0, 1, -1)]
+
+def create_touching_pair():
+    world = Box2D.b2World(gravity=(0, 0))
+    organism_a = OrganismFactory().organism(world, (10, 10), CELL_POSITIONS)
+    organism_b = OrganismFactory().organism(world, (10.3, 10), CELL_POSITIONS)
+    organisms = EntityRegistry()
+    organisms.add(organism_a)
+    organisms.add(organism_b)
+    listener = ContactListener()
+    world.contactListener = listener
+    world.Step(1.0 / 60, 6, 2)
+    return world, listener, organisms, organism_a, organism_b
+
+def test_touching_pair_records_one_contact_event():
+    _, listener, _, organism_a, organism_b = create_touching_pair()
+
+    # Several cell pairs overlap, but the organisms only get one event
+    assert sum(listener.touching_organisms[organism_a].values()) > 1
+    events = listener.get_contact_events()
+    assert len(events) == 1
+    assert {events[0]['organism_a'], events[0]['organism_b']} == {organism_a, organism_b}
+    assert listener.get_contact_events() == []
+
+def test_touching_ends_when_every_cell_contact_ends():
+    world, listener, _, organism_a, organism_b = create_touching_pair()
+    assert listener.is_organism_touching(organism_a)
+    assert listener.is_organism_touching(organism_b)
+
+    organism_b.body.position = (50, 50)
+    world.Step(1.0 / 60, 6, 2)
+
+    assert not listener.is_organism_touching(organism_a)
+    assert not listener.is_organism_touching(organism_b)
+    assert listener.touching_organisms == {}
+
+def test_removed_organism_leaves_adjacency_and_events():
+    _, listener, organisms, organism_a, organism_b = create_touching_pair()
+
+    organisms.remove(organism_b)
+    listener.remove_organism(organism_b)
+
+    assert not listener.is_organism_touching(organism_a)
+    assert listener.touching_organisms == {}
+    assert listener.contact_event_pairs == {}
+    assert listener.get_contact_events() == []
+
+def test_eaten_food_is_queued_once():
+    world = Box2D.b2World(gravity=(0, 0))
+    organisms = EntityRegistry()
+    food_morsels = EntityRegistry()
+    organisms.add(OrganismFactory().organism(world, (10, 10), CELL_POSITIONS))
+    food_morsel = FoodMorsel(world, (10.1, 10))
+    food_morsels.add(food_morsel)
+    food_morsels.add(FoodMorsel(world, (30, 30)))
+    listener = ContactListener()
+    world.contactListener = listener
+
+    world.Step(1.0 / 60, 6, 2)
+
+    assert listener.take_eaten_food_morsels() == [food_morsel]
+    assert food_morsel.eaten
+    assert listener.take_eaten_food_morsels() == []
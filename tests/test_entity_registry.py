@@ -0,0 +1,40 @@
+import pytest
+import Box2D
+from src.entity_registry import EntityRegistry
+from src.food_morsel import FoodMorsel
+
+def create_food_morsels(count):
+    world = Box2D.b2World(gravity=(0, 0))
+    return [FoodMorsel(world, (i, i)) for i in range(count)]
+
+def test_remove_swaps_last_entity_into_place():
+    registry = EntityRegistry()
+    food_morsels = create_food_morsels(3)
+    for food_morsel in food_morsels:
+        registry.add(food_morsel)
+
+    registry.remove(food_morsels[0])
+
+    assert list(registry) == [food_morsels[2], food_morsels[1]]
+    assert food_morsels[0] not in registry
+    assert food_morsels[2] in registry
+
+def test_ids_are_never_reused():
+    registry = EntityRegistry()
+    food_morsels = create_food_morsels(3)
+    registry.add(food_morsels[0])
+    registry.add(food_morsels[1])
+    registry.remove(food_morsels[1])
+    registry.clear()
+
+    assert registry.add(food_morsels[2]) == 2
+
+def test_bodies_lead_back_to_registered_entities():
+    registry = EntityRegistry()
+    food_morsel = create_food_morsels(1)[0]
+
+    registry.add(food_morsel)
+    assert food_morsel.body.userData is food_morsel
+
+    registry.remove(food_morsel)
+    assert food_morsel.body.userData is None
@@ -0,0 +1,30 @@
+import pytest
+from src.fixed_timestep import FixedTimestep
+
+def test_no_ticks_on_first_call():
+    timestep = FixedTimestep(60)
+    assert timestep.ticks_due(10.0) == 0
+
+def test_ticks_follow_elapsed_time():
+    timestep = FixedTimestep(60)
+    timestep.ticks_due(10.0)
+
+    # Half a second of real time is 30 ticks, regardless of how many frames it took
+    ticks = 0
+    for i in range(1, 11):
+        ticks += timestep.ticks_due(10.0 + i * 0.05)
+    assert ticks in (29, 30)  # Floating point may leave the last tick in the accumulator
+
+def test_leftover_time_becomes_tick_fraction():
+    timestep = FixedTimestep(10)
+    timestep.ticks_due(0.0)
+
+    assert timestep.ticks_due(0.25) == 2
+    assert timestep.tick_fraction() == pytest.approx(0.5)
+
+def test_ticks_per_frame_are_capped():
+    timestep = FixedTimestep(60)
+    timestep.ticks_due(0.0)
+
+    assert timestep.ticks_due(10.0) == FixedTimestep.MAX_TICKS_PER_FRAME
+    assert timestep.tick_fraction() == 0
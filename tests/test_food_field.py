@@ -0,0 +1,68 @@
+import pytest
+import Box2D
+import numpy as np
+from src.food_field import FoodField
+from src.cell import Cell
+from tests.organism_factory import OrganismFactory
+
+CELL_POSITIONS = [(0, 0, 0), (1, 0, -1)]
+
+def test_add_and_remove():
+    food_field = FoodField(20, 20)
+    food_field.add([(1, 1), (2, 2), (3, 3)])
+    assert len(food_field) == 3
+
+    food_field.remove(np.array([1]))
+    assert list(food_field.positions()) == [(1, 1), (3, 3)]
+
+def test_overlaps_finds_only_nearby_morsels():
+    food_field = FoodField(20, 20)
+    food_field.add([(5.0, 5.0), (5.5, 5.0), (9.0, 9.0)])
+
+    center_indices, food_indices = food_field.overlaps(np.array([5.0]), np.array([5.0]), np.array([0.6]))
+
+    assert sorted(food_indices.tolist()) == [0, 1]
+    assert center_indices.tolist() == [0, 0]
+
+def test_overlaps_wrap_across_world_edges():
+    food_field = FoodField(20, 20)
+    food_field.add([(19.8, 10.0)])
+
+    center_indices, food_indices = food_field.overlaps(np.array([0.1]), np.array([10.0]), np.array([0.6]))
+
+    assert food_indices.tolist() == [0]
+
+def test_consume_nourishes_organism_and_removes_morsel():
+    world = Box2D.b2World(gravity=(0, 0))
+    organism = OrganismFactory().organism(world, (10, 10), CELL_POSITIONS)
+    health_before = organism.health()
+
+    food_field = FoodField(40, 40)
+    # One morsel on the second cell's center (0.6, 0.35 in body coordinates), one far away
+    food_field.add([(10.6, 10.35), (30, 30)])
+
+    assert food_field.consume([organism]) == 1
+    assert organism.health() > health_before
+    assert list(food_field.positions()) == [(30, 30)]
+
+def test_morsel_feeds_only_one_organism():
+    world = Box2D.b2World(gravity=(0, 0))
+    organism_a = OrganismFactory().organism(world, (10, 10), CELL_POSITIONS)
+    organism_b = OrganismFactory().organism(world, (10.3, 10), CELL_POSITIONS)
+    health_before = organism_a.health() + organism_b.health()
+
+    food_field = FoodField(40, 40)
+    food_field.add([(10.3, 10.0)])
+
+    assert food_field.consume([organism_a, organism_b]) == 1
+    assert organism_a.health() + organism_b.health() == health_before + 2 * Cell.FOOD_MORSEL_HEALTH_VALUE
+
+def test_positions_in_rect_matches_a_full_scan():
+    food_field = FoodField(20, 20)
+    food_field.add_random(300)
+
+    rect = (3.3, 11.0, 9.7, 19.2)
+    expected = [(x, y) for x, y in food_field.positions() if rect[0] <= x <= rect[2] and rect[1] <= y <= rect[3]]
+
+    assert sorted(food_field.positions_in_rect(*rect)) == sorted(expected)
+    assert food_field.positions_in_rect(25, 25, 30, 30) == []
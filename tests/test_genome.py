@@ -0,0 +1,54 @@
+import pytest
+import random
+from src.genome import Genome
+
+def test_bits_round_trip_keeps_leading_zeros():
+    genome_string = "0001011000"
+
+    bits, length = Genome.to_bits(genome_string)
+
+    assert length == 10
+    assert Genome.from_bits(bits, length) == genome_string
+
+def test_splice_bits_matches_string_splice():
+    parent_a = "1100101111101110101001"
+    parent_b = "0110000010001110101110"
+    bits_a, length_a = Genome.to_bits(parent_a)
+    bits_b, length_b = Genome.to_bits(parent_b)
+
+    random.seed(4)
+    offspring = Genome.from_bits(Genome.splice_bits(bits_a, length_a, bits_b, length_b), length_b)
+    random.seed(4)
+    splice_point = random.randint(0, len(parent_a) - 1)
+
+    assert offspring == parent_a[:splice_point] + parent_b[splice_point:]
+
+def test_mutate_flips_bits_at_the_mutation_rate():
+    random.seed(7)
+    length = 10000
+    mutated = Genome.mutate_bits(0, length, 0.01)
+
+    assert 70 < bin(mutated).count("1") < 130
+    assert Genome.mutate_bits(0b1010, 4, 0) == 0b1010
+    assert Genome.mutate_bits(0b1010, 4, 1) == 0b0101
+
+def test_mutate_keeps_string_length():
+    genome_string = "0" * 398
+
+    mutated = Genome.mutate(genome_string, mutation_rate=0.05)
+
+    assert len(mutated) == 398
+    assert set(mutated) <= {"0", "1"}
+
+def test_placement_deltas_from_bits_match_the_built_genome():
+    random.seed(7)
+    for _ in range(50):
+        genome_string = Genome().value()
+        prefix = ''.join(random.choice('01') for _ in range(Genome.cell_count_prefix_length()))
+        genome_string = prefix + genome_string[len(prefix):]
+        bits, length = Genome.to_bits(genome_string)
+        assert Genome.placement_deltas_from_bits(bits, length) == Genome.from_string(genome_string).placement_deltas()
+
+def test_placement_deltas_from_bits_gives_up_on_short_genomes():
+    bits, length = Genome.to_bits('1' * 14 + '0' * 24)
+    assert Genome.placement_deltas_from_bits(bits, length) is None
@@ -0,0 +1,22 @@
+import pytest
+import math
+from src.hex_geometry import HexGeometry
+
+def test_center():
+    x, y = HexGeometry.center(1, 1, 2)
+    assert x == pytest.approx(3)
+    assert y == pytest.approx(3 * math.sqrt(3))
+
+def test_vertices_match_direct_trigonometry():
+    q, r, radius = 2, -1, 0.4
+    expected = []
+    for i in range(6):
+        angle = (math.pi / 3) * i
+        x = ((3/2 * q) * radius) + radius * math.cos(angle)
+        y = ((math.sqrt(3)/2 * q + math.sqrt(3) * r) * radius) + radius * math.sin(angle)
+        expected.append((x, y))
+
+    assert list(HexGeometry.vertices(q, r, radius)) == expected
+
+def test_vertices_are_cached():
+    assert HexGeometry.vertices(3, -2, 0.4) is HexGeometry.vertices(3, -2, 0.4)
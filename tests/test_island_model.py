@@ -0,0 +1,33 @@
+import pytest
+from src.island_model import IslandModel
+from src.simulation import Simulation
+
+def test_emigrant_genomes_are_genome_strings():
+    simulation = Simulation(organism_count=4, starting_food_count=0, verbose=False)
+
+    emigrants = simulation.emigrant_genomes(2)
+
+    assert len(emigrants) == 2
+    assert all(set(genome_string) <= {'0', '1'} for genome_string in emigrants)
+
+def test_add_immigrants():
+    source = Simulation(organism_count=3, starting_food_count=0, verbose=False)
+    destination = Simulation(organism_count=3, starting_food_count=0, verbose=False)
+
+    immigrants = source.emigrant_genomes(2)
+    destination.add_immigrants(immigrants)
+
+    assert len(destination.organisms) == 5
+    assert [organism.genome() for organism in destination.organisms[-2:]] == immigrants
+
+def test_islands_run_and_report_records():
+    island_model = IslandModel(2, migration_interval=30, organism_count=4, starting_food_count=20, seed=1)
+    island_model.start()
+    try:
+        records = island_model.run(60)
+    finally:
+        island_model.stop()
+
+    assert records['ticks'] == 60
+    assert island_model.immigrants[0] and island_model.immigrants[1]
+    assert all(records is not None for records in island_model.island_records)
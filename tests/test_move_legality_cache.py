@@ -0,0 +1,46 @@
+import pytest
+from src.move_legality_cache import MoveLegalityCache
+from src.cellular_body import CellularBody
+from src.cell import Cell
+
+def test_least_recently_used_entry_is_evicted():
+    cache = MoveLegalityCache(max_size=2)
+    cache.put('a', (True, None))
+    cache.put('b', (False, None))
+    cache.get('a')
+
+    cache.put('c', (True, None))
+
+    assert cache.get('b') is None
+    assert cache.get('a') == (True, None)
+    assert len(cache) == 2
+
+def test_hit_and_miss_counters():
+    cache = MoveLegalityCache()
+    cache.get('a')
+    cache.put('a', (True, None))
+    cache.get('a')
+    cache.get('a')
+
+    assert cache.stats()['hits'] == 2
+    assert cache.stats()['misses'] == 1
+    assert cache.hit_rate() == pytest.approx(2 / 3)
+
+def test_translated_bodies_share_entries():
+    def build_body(offset_q):
+        return CellularBody([
+            Cell((offset_q, 0, -offset_q), 1, (0, 0, 0), (0, 0, 0), [(0, 0, 0)]),
+            Cell((offset_q, -1, 1 - offset_q), 1, (0, 0, 0), (0, 0, 0), [(0, 0, 0)]),
+        ])
+
+    CellularBody.legality_cache.clear()
+    body = build_body(0)
+    translated_body = build_body(5)
+
+    legal, shape_after_move = body.check_move(body.cells[1], (-1, 1, 0))
+    assert legal
+    assert shape_after_move == ((0, 0, 0), (-1, 0, 1))
+
+    assert translated_body.check_move(translated_body.cells[1], (-1, 1, 0)) == (legal, shape_after_move)
+    assert CellularBody.legality_cache.hits == 1
+    assert CellularBody.legality_cache.misses == 1
@@ -1,5 +1,6 @@
 import pytest
 import Box2D
+import math
 from src.organism import Organism
 from src.cell import Cell
 from src.cellular_body import CellularBody
@@ -17,3 +18,65 @@ def test_organism_initialization():
     assert organism.body.position.x == 5
     assert organism.body.position.y == 10
     assert len(organism.body.fixtures) == 2  # Two cells = two fixtures
+
+def test_interpolated_transform():
+    world = Box2D.b2World(gravity=(0, 0))
+    cells = [Cell((0, 0, 0), 1, (0, 255, 0), (0, 0, 0), [(0, 0, 0), (0, 0, 0)])]
+    organism = Organism(world, CellularBody(cells), (0, 0))
+
+    organism.save_transform()
+    organism.body.position = (10, 20)
+
+    halfway = organism.interpolated_transform(0.5)
+    assert halfway.position.x == pytest.approx(5)
+    assert halfway.position.y == pytest.approx(10)
+
+    latest = organism.interpolated_transform(1.0)
+    assert latest.position.x == pytest.approx(10)
+
+def test_moving_a_cell_reshapes_only_its_fixture():
+    world = Box2D.b2World(gravity=(0, 0))
+    cell = Cell((0, 0, 0), 1, (0, 255, 0), (0, 0, 0), [(0, 0, 0), (0, 0, 0)])
+    mover_cell = Cell((1, 0, -1), 1, (0, 255, 0), (0, 0, 0), [(0, 0, 0), (0, 0, 0)])
+    organism = Organism(world, CellularBody([cell, mover_cell]), (0, 0))
+
+    fixtures_before = dict(organism.cell_fixtures)
+    unmoved_vertices = organism.cell_fixtures[cell].shape.vertices
+
+    mover_cell.move((0, 1, -1))
+    organism.update_clock()
+
+    assert organism.cell_fixtures == fixtures_before
+    assert len(organism.body.fixtures) == 2
+    assert organism.cell_fixtures[cell].shape.vertices == unmoved_vertices
+    moved_x = sum(x for x, y in organism.cell_fixtures[mover_cell].shape.vertices) / 6
+    moved_y = sum(y for x, y in organism.cell_fixtures[mover_cell].shape.vertices) / 6
+    assert moved_x == pytest.approx(1.5)
+    assert moved_y == pytest.approx(3 * math.sqrt(3) / 2)
+
+def test_running_totals_follow_cell_changes():
+    world = Box2D.b2World(gravity=(0, 0))
+    cells = [
+        Cell((0, 0, 0), 1, (0, 255, 0), (0, 0, 0), [(0, 0, 0)]),
+        Cell((1, 0, -1), 1, (0, 255, 0), (0, 0, 0), [(0, 0, 0)])
+    ]
+    organism = Organism(world, CellularBody(cells), (0, 0))
+    assert organism.health() == 2 * Cell.STARTING_HEALTH
+
+    organism.update_clock()
+    assert organism.health() == 2 * (Cell.STARTING_HEALTH - 1)
+
+    organism.nourish()
+    organism.subtract_reproduction_cost()
+    expected_health = 2 * (Cell.STARTING_HEALTH - 1 + Cell.FOOD_MORSEL_HEALTH_VALUE - Cell.REPRODUCTION_COST)
+    assert organism.health() == expected_health
+
+    cells[0].stimulate()
+    assert organism.stimulation_count() == 1
+
+    cells[0].health = 0
+    assert organism.is_alive()
+    cells[1].health = 1
+    organism.update_clock()
+    assert not organism.is_alive()
+    assert organism.health() == 0
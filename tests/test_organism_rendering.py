@@ -46,3 +46,20 @@ def test_bounding_rectangle():
     # Assert the four corners match expected values
     # min_x=2.0, min_y=2.0, max_x=7.0, max_y=5.0
     assert bounding_rectangle == (2.0, 2.0, 7.0, 5.0)  # (min_x, min_y, max_x, max_y)
+
+def test_vertices_match_box2d_fixtures():
+    world = Box2D.b2World(gravity=(0, 0))
+    cells = [
+        Cell((0, 0, 0), 0.4, (255, 0, 0), (255, 100, 100), []),
+        Cell((1, -1, 0), 0.4, (255, 0, 0), (255, 100, 100), []),
+    ]
+    organism = Organism(world, CellularBody(cells), (5, 5))
+    organism.body.angle = 0.7
+
+    from src.camera import Camera
+    organism_rendering = OrganismRendering(organism, Screen(20, 20), Camera(10, 10, 20, 20))
+
+    for cell, cell_vertices in zip(cells, organism_rendering.vertices()):
+        fixture_vertices = [organism.body.transform * vertex for vertex in organism.cell_fixtures[cell].shape.vertices]
+        for x, y in cell_vertices:
+            assert any(x == pytest.approx(v.x, abs=1e-5) and y == pytest.approx(v.y, abs=1e-5) for v in fixture_vertices)
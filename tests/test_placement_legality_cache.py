@@ -0,0 +1,34 @@
+import pytest
+import random
+from src.cellular_body_builder import CellularBodyBuilder
+from src.genome import Genome
+from src.placement_legality_cache import PlacementLegalityCache
+
+def test_overlapping_placement_is_illegal():
+    cache = PlacementLegalityCache()
+    assert cache.is_legal([(0, 0, 0), (1, -1, 0), (0, 1, -1)])
+    assert not cache.is_legal([(0, 0, 0), (1, -1, 0), (-1, 1, 0)])
+    assert not cache.is_legal([(0, 0, 0), (0, 0, 0)])
+
+def test_repeated_placement_is_a_hit():
+    cache = PlacementLegalityCache()
+    cache.is_legal([(0, 0, 0), (1, -1, 0)])
+    cache.is_legal([(0, 0, 0), (1, -1, 0)])
+    assert cache.stats() == {'hits': 1, 'misses': 1, 'size': 1}
+
+def test_cache_clears_when_full():
+    cache = PlacementLegalityCache(max_size=2)
+    cache.is_legal([(0, 0, 0), (1, -1, 0)])
+    cache.is_legal([(0, 0, 0), (0, 1, -1)])
+    cache.is_legal([(0, 0, 0), (-1, 1, 0)])
+    assert len(cache) == 1
+
+def test_agrees_with_built_bodies():
+    random.seed(3)
+    cache = PlacementLegalityCache()
+    for _ in range(40):
+        genome_string = ''.join(random.choice('01') for _ in range(Genome.cell_count_prefix_length())) + Genome().value()[14:]
+        genome = Genome.from_string(genome_string)
+        cellular_body = CellularBodyBuilder(genome.cell_genes()).cellular_body()
+        assert cache.is_legal(genome.placement_deltas()) == cellular_body.is_legal()
+        cellular_body.release()
@@ -0,0 +1,84 @@
+import pytest
+import Box2D
+from src.camera import Camera
+from src.genome import Genome
+from src.organism_rendering import OrganismRendering
+from src.render_snapshot import RenderSnapshot
+from src.screen import Screen
+from tests.organism_factory import OrganismFactory
+
+WORLD_SIZE = 20
+
+CELL_POSITIONS = [(0, 0, 0), (1, -1, 0)]
+GENOME = Genome.from_string("0" * 62)
+organism_factory = OrganismFactory()
+
+def test_matches_organism_rendering_with_ghosts():
+    world = Box2D.b2World(gravity=(0, 0))
+    # One organism in the middle, one hanging over the bottom-left corner
+    organisms = [
+        organism_factory.organism(world, (10, 10), CELL_POSITIONS, angle=0.3, genome=GENOME),
+        organism_factory.organism(world, (0.2, 0.1), CELL_POSITIONS, angle=1.1, genome=GENOME),
+    ]
+    camera = Camera(WORLD_SIZE, WORLD_SIZE, 30, 30)
+    camera.x, camera.y = -3, 2
+
+    snapshot = RenderSnapshot(organisms, WORLD_SIZE, WORLD_SIZE)
+    expected = []
+    for organism in organisms:
+        organism_rendering = OrganismRendering(organism, Screen(30, 30), camera)
+        expected.extend(organism_rendering._cell_renderings_with_offset(WORLD_SIZE, 0))
+        expected.extend(organism_rendering.ghost_rendering_with_grid_offset(WORLD_SIZE, WORLD_SIZE, WORLD_SIZE, 0))
+
+    actual = snapshot.cell_renderings(camera, WORLD_SIZE, 0)
+    assert len(actual) == len(expected) == 2 + 2 * 4
+    for actual_rendering, expected_rendering in zip(actual, expected):
+        assert actual_rendering['fill_color'] == expected_rendering['fill_color']
+        assert actual_rendering['border_color'] == expected_rendering['border_color']
+        for actual_vertex, expected_vertex in zip(actual_rendering['vertices'], expected_rendering['vertices']):
+            assert actual_vertex == pytest.approx(list(expected_vertex))
+
+def test_bounding_rectangles_match_organism_rendering():
+    world = Box2D.b2World(gravity=(0, 0))
+    organisms = [
+        organism_factory.organism(world, (5, 7), CELL_POSITIONS, angle=0.5, genome=GENOME),
+        organism_factory.organism(world, (12, 3), CELL_POSITIONS, angle=2.0, genome=GENOME),
+    ]
+
+    snapshot = RenderSnapshot(organisms, WORLD_SIZE, WORLD_SIZE)
+
+    for organism, bounding_rectangle in zip(organisms, snapshot.bounding_rectangles):
+        assert bounding_rectangle.tolist() == pytest.approx(OrganismRendering(organism, None, None).bounding_rectangle())
+
+def test_wrap_positions_match_organism_rendering():
+    world = Box2D.b2World(gravity=(0, 0))
+    organisms = [
+        organism_factory.organism(world, (10, 10), CELL_POSITIONS, genome=GENOME),
+        organism_factory.organism(world, (-3, 25), CELL_POSITIONS, genome=GENOME),
+        organism_factory.organism(world, (21, 5), CELL_POSITIONS, genome=GENOME),
+    ]
+
+    wrap_positions = RenderSnapshot(organisms, WORLD_SIZE, WORLD_SIZE).wrap_positions()
+
+    expected = []
+    for organism in organisms:
+        wrap_position = OrganismRendering(organism, None, None).get_wrap_position(WORLD_SIZE, WORLD_SIZE)
+        if wrap_position:
+            expected.append((organism, wrap_position))
+    assert [organism for organism, _ in wrap_positions] == [organism for organism, _ in expected]
+    for (_, actual_position), (_, expected_position) in zip(wrap_positions, expected):
+        assert actual_position == pytest.approx(expected_position)
+
+def test_cell_renderings_for_some_organisms_without_ghosts():
+    world = Box2D.b2World(gravity=(0, 0))
+    organisms = [
+        organism_factory.organism(world, (10, 10), CELL_POSITIONS, genome=GENOME),
+        organism_factory.organism(world, (0.2, 0.1), CELL_POSITIONS, genome=GENOME),
+    ]
+    other = organism_factory.organism(world, (5, 5), CELL_POSITIONS, genome=GENOME)
+    camera = Camera(WORLD_SIZE, WORLD_SIZE, 30, 30)
+
+    snapshot = RenderSnapshot(organisms, WORLD_SIZE, WORLD_SIZE)
+
+    assert len(snapshot.cell_renderings(camera, 0, 0, [organisms[1], other], ghosts=False)) == 2
+    assert len(snapshot.cell_renderings(camera, 0, 0, [organisms[1]])) == 2 * 4
@@ -0,0 +1,87 @@
+import pytest
+import sys
+from src.simulation import Simulation
+from src.genome import Genome
+from src.organism import Organism
+from tests.organism_factory import OrganismFactory
+
+def test_simulation_initialization():
+    simulation = Simulation(organism_count=5, starting_food_count=10, verbose=False)
+
+    assert len(simulation.organisms) == 5
+    assert len(simulation.food_morsels) == 10
+    assert simulation.world.contactListener == simulation.contact_listener
+
+def test_step_advances_frame_count():
+    simulation = Simulation(organism_count=5, starting_food_count=10, verbose=False)
+
+    for i in range(10):
+        simulation.step()
+
+    assert simulation.frame_count == 10
+
+def test_food_is_added_every_fps_check_interval():
+    simulation = Simulation(organism_count=5, starting_food_count=0, verbose=False)
+
+    for i in range(Simulation.FPS_CHECK_INTERVAL):
+        simulation.step()
+
+    assert simulation.run_cycles == 1
+    assert len(simulation.food_morsels) <= Simulation.FOOD_INCREMENT
+
+def test_simulation_does_not_import_pygame():
+    for module_name in ['src.simulation', 'src.organism', 'src.organism_rendering', 'src.contact_listener']:
+        module = sys.modules[module_name]
+        assert 'pygame' not in vars(module)
+
+def test_food_field_keeps_food_out_of_box2d():
+    simulation = Simulation(organism_count=5, starting_food_count=50, food_field=True, verbose=False)
+
+    assert simulation.food_count() == 50
+    assert simulation.world.bodyCount == 5
+
+    for i in range(10):
+        simulation.step()
+    assert simulation.food_count() <= 50
+
+def test_entities_in_rect_finds_only_nearby_organisms_and_food():
+    simulation = Simulation(organism_count=20, starting_food_count=50, verbose=False)
+    simulation.step()
+    rect = (30, 30, 80, 65)
+
+    organisms, food_positions = simulation.entities_in_rect(*rect)
+
+    for organism in simulation.organisms:
+        x, y = organism.body.position
+        if rect[0] + 2 < x < rect[2] - 2 and rect[1] + 2 < y < rect[3] - 2:
+            assert organism in organisms
+        if x < rect[0] - 5 or x > rect[2] + 5 or y < rect[1] - 5 or y > rect[3] + 5:
+            assert organism not in organisms
+    expected_food = [(x, y) for x, y in simulation.food_positions() if rect[0] <= x <= rect[2] and rect[1] <= y <= rect[3]]
+    assert set(expected_food) <= set(food_positions)
+
+def test_removed_organism_does_not_reproduce_from_old_contact():
+    simulation = Simulation(organism_count=2, starting_food_count=0, verbose=False)
+    simulation.world_manager.clear()
+    organism_a = OrganismFactory().organism(simulation.world, (10, 10), [(0, 0, 0), (0, 1, -1)], genome=Genome())
+    organism_b = OrganismFactory().organism(simulation.world, (10.3, 10), [(0, 0, 0), (0, 1, -1)], genome=Genome())
+    simulation.world_manager.add_organism(organism_a)
+    simulation.world_manager.add_organism(organism_b)
+    simulation.world.Step(Simulation.PHYSICS_TIME_STEP, 6, 2)
+    for cell in organism_a.cells() + organism_b.cells():
+        cell.stimulation_count = Organism.MINIMUM_STIMULATION_COUNT
+
+    # organism_b dies, and a newborn gets its cell rows and body slot
+    for cell in organism_b.cells():
+        cell.health = 0
+    simulation.update_organisms()
+    newborn = simulation.generate_organism()
+    simulation.world_manager.add_organism(newborn)
+    for cell in newborn.cells():
+        cell.stimulation_count = Organism.MINIMUM_STIMULATION_COUNT
+    health_before = (organism_a.health(), newborn.health())
+
+    simulation.reproduce()
+
+    assert len(simulation.organisms) == 2
+    assert (organism_a.health(), newborn.health()) == health_before
@@ -0,0 +1,53 @@
+import pytest
+import Box2D
+from src.world_manager import WorldManager
+from src.simulation import Simulation
+from src.food_morsel import FoodMorsel
+
+def test_remove_food_morsel_returns_body_to_pool():
+    world_manager = WorldManager()
+    food_morsel = FoodMorsel(world_manager.world, (5, 5), body_pool=world_manager.food_body_pool)
+    world_manager.add_food_morsel(food_morsel)
+
+    world_manager.remove_food_morsel(food_morsel)
+
+    assert len(world_manager.food_morsels) == 0
+    assert len(world_manager.food_body_pool) == 1
+    assert not food_morsel.body.active
+
+def test_clear_keeps_walls():
+    world_manager = WorldManager()
+    wall = world_manager.world.CreateStaticBody(position=(0, 0))
+    world_manager.add_wall(wall)
+    for i in range(3):
+        food_morsel = FoodMorsel(world_manager.world, (i, i), body_pool=world_manager.food_body_pool)
+        world_manager.add_food_morsel(food_morsel)
+
+    world_manager.clear()
+
+    body_counts = world_manager.body_counts()
+    assert body_counts['food'] == 0
+    assert body_counts['walls'] == 1
+    assert body_counts['pooled'] == 3
+    assert body_counts['total'] == 4
+
+def test_repeated_runs_do_not_leak_bodies():
+    simulation = Simulation(organism_count=10, starting_food_count=20, verbose=False)
+    body_counts = simulation.world_manager.body_counts()
+
+    for _ in range(5):
+        simulation.start_next_run()
+
+    assert simulation.world.bodyCount == body_counts['total']
+    assert len(simulation.organisms) == 10
+    assert len(simulation.food_morsels) == 20
+    body_counts = simulation.world_manager.body_counts()
+    assert body_counts['total'] == body_counts['organisms'] + body_counts['food'] + body_counts['walls'] + body_counts['pooled']
+
+def test_simulation_lists_are_the_world_managers():
+    simulation = Simulation(organism_count=5, starting_food_count=5, verbose=False)
+
+    simulation.restart_after_collapse()
+
+    assert simulation.organisms is simulation.world_manager.organisms
+    assert simulation.food_morsels is simulation.world_manager.food_morsels